@@ -0,0 +1,94 @@
+from argparse import ArgumentParser, Namespace
+from pathlib import PurePath
+from timeit import repeat
+from typing import Callable, Iterator, Mapping, Sequence, Tuple
+
+from std2.difflib import trans_inplace
+
+from chadtree.view.diff import trans_keyed
+
+_Rows = Tuple[Sequence[PurePath], Sequence[str], Mapping[PurePath, int]]
+
+
+def _parse_args() -> Namespace:
+    parser = ArgumentParser()
+    parser.add_argument("--rows", type=int, default=50_000)
+    parser.add_argument("--expand", type=int, default=5_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    return parser.parse_args()
+
+
+def _rows(keys: Sequence[PurePath], hashes: Sequence[str]) -> _Rows:
+    return keys, hashes, {key: idx for idx, key in enumerate(keys)}
+
+
+def _tree(rows: int, expand: int) -> Tuple[_Rows, _Rows]:
+    """
+    -> (collapsed, expanded) around a folder in the middle of the tree
+    """
+
+    root = PurePath("/", "root")
+    mid = rows // 2
+    keys = tuple(root / f"{idx:08d}" for idx in range(rows))
+    hashes = tuple(str(idx) for idx in range(rows))
+
+    inserted = tuple(keys[mid] / f"{idx:08d}" for idx in range(expand))
+    e_keys = (*keys[: mid + 1], *inserted, *keys[mid + 1 :])
+    e_hashes = (
+        *hashes[:mid],
+        f"{mid}_open",
+        *(f"{mid}_{idx}" for idx in range(expand)),
+        *hashes[mid + 1 :],
+    )
+    return _rows(keys, hashes), _rows(e_keys, e_hashes)
+
+
+def _filter(rows: _Rows, step: int) -> _Rows:
+    keys, hashes, _ = rows
+    return _rows(keys[::step], hashes[::step])
+
+
+def _generic(src: _Rows, dest: _Rows) -> None:
+    tuple(trans_inplace(src=src[1], dest=dest[1], unifying=10))
+
+
+def _keyed(src: _Rows, dest: _Rows) -> None:
+    (s_keys, s_hashes, s_lookup), (d_keys, d_hashes, d_lookup) = src, dest
+    trans_keyed(
+        s_keys,
+        src_hashes=s_hashes,
+        src_lookup=s_lookup,
+        dest_keys=d_keys,
+        dest_hashes=d_hashes,
+        dest_lookup=d_lookup,
+        unifying=10,
+    )
+
+
+def _cases(args: Namespace) -> Iterator[Tuple[str, _Rows, _Rows]]:
+    collapsed, expanded = _tree(args.rows, expand=args.expand)
+    yield "expand", collapsed, expanded
+    yield "collapse", expanded, collapsed
+    yield "filter", collapsed, _filter(collapsed, step=7)
+    yield "unfilter", _filter(collapsed, step=7), collapsed
+
+
+def _time(fn: Callable[[_Rows, _Rows], None], src: _Rows, dest: _Rows, n: int) -> float:
+    return min(repeat(lambda: fn(src, dest), number=1, repeat=n))
+
+
+def main() -> None:
+    """
+    No numbers are on record, run it before claiming either engine is faster
+    """
+
+    args = _parse_args()
+    print(f"{'case':<10}{'generic':>12}{'keyed':>12}")
+    for name, src, dest in _cases(args):
+        generic = _time(_generic, src=src, dest=dest, n=args.repeat)
+        keyed = _time(_keyed, src=src, dest=dest, n=args.repeat)
+        print(f"{name:<10}{generic * 1000:>10.1f}ms{keyed * 1000:>10.1f}ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,44 @@
+from argparse import ArgumentParser, Namespace
+from subprocess import PIPE, run
+from sys import executable
+from typing import Iterator, Sequence, Tuple
+
+
+def _parse_args() -> Namespace:
+    parser = ArgumentParser()
+    parser.add_argument("--module", default="chadtree.client")
+    parser.add_argument("--top", type=int, default=20)
+    return parser.parse_args()
+
+
+def _importtime(module: str) -> Sequence[Tuple[int, int, str]]:
+    """
+    -> (self us, cumulative us, module), as reported by `-X importtime`
+    """
+
+    cmd = (executable, "-X", "importtime", "-c", f"import {module}")
+    proc = run(cmd, stderr=PIPE, text=True, check=True)
+
+    def cont() -> Iterator[Tuple[int, int, str]]:
+        for line in proc.stderr.splitlines():
+            _, _, report = line.partition("import time:")
+            self_us, _, rest = report.partition("|")
+            cumulative, _, name = rest.partition("|")
+            if self_us.strip().isdigit():
+                yield int(self_us), int(cumulative), name.rstrip()
+
+    return tuple(cont())
+
+
+def main() -> None:
+    args = _parse_args()
+    rows = _importtime(args.module)
+    total = sum(self_us for self_us, _, _ in rows)
+    print(f"{'self':>10}{'cumulative':>12}  module")
+    for self_us, cumulative, name in sorted(rows, reverse=True)[: args.top]:
+        print(f"{self_us / 1000:>8.1f}ms{cumulative / 1000:>10.1f}ms  {name}")
+    print(f"{total / 1000:>8.1f}ms total, {len(rows)} modules")
+
+
+if __name__ == "__main__":
+    main()
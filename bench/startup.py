@@ -0,0 +1,67 @@
+from argparse import ArgumentParser, Namespace
+from json import loads
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from timeit import repeat
+from typing import Any, Callable
+
+from std2.pickle import decode
+from yaml import safe_load
+
+from chad_types import ARTIFACT, Artifact
+from chadtree.consts import CONFIG_YML
+from chadtree.settings.cache import cached
+
+
+def _parse_args() -> Namespace:
+    parser = ArgumentParser()
+    parser.add_argument("--repeat", type=int, default=5)
+    return parser.parse_args()
+
+
+def _before() -> None:
+    decode(Artifact, safe_load(ARTIFACT.read_text("UTF-8")))
+    safe_load(CONFIG_YML.read_text("UTF-8"))
+
+
+def _after(cache_dir: Path) -> None:
+    cached(
+        "artifact",
+        cache_dir=cache_dir,
+        sources=(ARTIFACT,),
+        load=lambda: decode(Artifact, loads(ARTIFACT.read_text("UTF-8"))),
+    )
+    cached(
+        "defaults",
+        cache_dir=cache_dir,
+        sources=(CONFIG_YML,),
+        load=lambda: safe_load(CONFIG_YML.read_text("UTF-8")),
+    )
+
+
+def _cold(cache_dir: Path) -> None:
+    for path in cache_dir.glob("*.pickle"):
+        path.unlink()
+    _after(cache_dir)
+
+
+def _time(fn: Callable[[], Any], n: int) -> float:
+    return min(repeat(fn, number=1, repeat=n))
+
+
+def main() -> None:
+    args = _parse_args()
+    # never touch the real cache
+    with TemporaryDirectory() as tmp:
+        cache_dir = Path(tmp)
+        cases = (
+            ("before", _before),
+            ("cold", lambda: _cold(cache_dir)),
+            ("warm", lambda: _after(cache_dir)),
+        )
+        for name, fn in cases:
+            print(f"{name:<10}{_time(fn, n=args.repeat) * 1000:>10.1f}ms")
+
+
+if __name__ == "__main__":
+    main()
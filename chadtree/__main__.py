@@ -4,6 +4,7 @@ from pathlib import Path
 from subprocess import DEVNULL, run
 from sys import executable, stderr, stdout, version_info
 from textwrap import dedent
+from time import monotonic
 from typing import Union
 from webbrowser import open as open_w
 
@@ -142,13 +143,16 @@ elif _command == "run":
         print(msg, end="", file=stderr)
         exit(1)
     else:
+        t1 = monotonic()
+        # all but `.client` are already imported above, so this is our own import time
         from pynvim import attach
         from pynvim_pp.client import run_client
 
         from .client import ChadClient
 
+        imported = monotonic() - t1
         nvim = attach("socket", path=_args.socket)
-        code = run_client(nvim, client=ChadClient())
+        code = run_client(nvim, client=ChadClient(imported=imported))
         exit(code)
 
 else:
@@ -1,25 +1,90 @@
-from .transitions import (
-    autocmds,
-    click,
-    collapse,
-    copy_name,
-    cut_copy,
-    delete,
-    filter,
-    focus,
-    help,
-    new,
-    open_system,
-    quit,
-    refresh,
-    rename,
-    resize,
-    schedule_update,
-    selection,
-    stat,
-    toggle_open,
-    toggles,
-    version_ctl,
-)
+from importlib import import_module
+from pkgutil import iter_modules
+from sys import modules
+from typing import Any, Mapping, MutableSequence, Optional, Sequence
+
+from pynvim import Nvim
+
+from .registry import defined_in, rpc
+from .settings.types import Settings
+from .state.types import State
+from .transitions import autocmds, jobs, schedule_update, toggle_open, version_ctl
+from .transitions.types import Stage
+
+# the modules above register autocmds or background events, draw the first paint
+# or receive events from worker threads
+# the ones below are only imported the first time one of their handlers is called
+_LAZY: Mapping[str, Sequence[str]] = {
+    "click": ("_primary", "_secondary", "_tertiary", "_v_split", "_h_split"),
+    "collapse": ("_collapse",),
+    "copy_name": ("_copy_name", "_copy_basename"),
+    "cut_copy": ("_cut", "_copy"),
+    "delete": ("_delete", "_trash"),
+    "filter": ("_clear_filter", "_filter"),
+    "focus": (
+        "_jump_to_current",
+        "_refocus",
+        "_change_dir",
+        "_change_focus",
+        "_change_focus_up",
+    ),
+    "help": ("_help",),
+    "new": ("_new",),
+    "open_system": ("_open_sys",),
+    "profile": ("_profile",),
+    "quit": ("_quit",),
+    "refresh": ("refresh",),
+    "rename": ("_rename",),
+    "resize": ("_bigger", "_smaller"),
+    "selection": ("_clear_selection", "_select"),
+    "stat": ("_stat",),
+    "toggles": ("_toggle_hidden", "_toggle_follow", "_toggle_version_control"),
+}
+
+
+def _lazy(module: str, attr: str) -> None:
+    def handler(
+        nvim: Nvim, state: State, settings: Settings, *args: Any
+    ) -> Optional[Stage]:
+        mod = import_module(f"{__package__}.transitions.{module}")
+        return getattr(mod, attr)(nvim, state, settings, *args)
+
+    # same qualname, so the same rpc name as the real handler
+    handler.__qualname__ = handler.__name__ = attr
+    rpc(blocking=False)(handler)
+
+
+for module, attrs in _LAZY.items():
+    for attr in attrs:
+        _lazy(module, attr=attr)
+
+
+def check_lazy() -> None:
+    """
+    For CI, `_LAZY` is kept by hand
+
+    -> Has to run after `client` is imported, before any handler is called
+    """
+
+    package = f"{__package__}.transitions"
+    names = tuple(name for _, name, _ in iter_modules(import_module(package).__path__))
+    eager = {name for name in names if f"{package}.{name}" in modules}
+
+    errors: MutableSequence[str] = []
+    for name in names:
+        if name in eager:
+            if name in _LAZY:
+                errors.append(f"{name}: imported eagerly, yet listed as lazy")
+        else:
+            handlers = defined_in(import_module(f"{package}.{name}").__name__)
+            listed = {*_LAZY.get(name, ())}
+            if handlers != listed:
+                errors.append(
+                    f"{name}: defines {sorted(handlers)}, lists {sorted(listed)}"
+                )
+
+    if errors:
+        raise AssertionError("\n".join(errors))
+
 
 ____ = None
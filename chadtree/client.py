@@ -1,43 +1,67 @@
 from asyncio.events import AbstractEventLoop
 from multiprocessing import cpu_count
 from os import linesep
-from pathlib import Path
+from pathlib import Path, PurePath
 from platform import uname
+from queue import Empty
 from sys import executable, stderr
 from textwrap import dedent
-from time import monotonic
-from typing import Any, MutableMapping, Optional, cast
+from time import monotonic, perf_counter, sleep
+from typing import (
+    Any,
+    MutableMapping,
+    MutableSequence,
+    Optional,
+    Sequence,
+    Tuple,
+    cast,
+)
 
 from pynvim import Nvim
 from pynvim.api.common import NvimError
 from pynvim_pp.client import Client
-from pynvim_pp.highlight import highlight
 from pynvim_pp.lib import threadsafe_call, write
 from pynvim_pp.logging import log
-from pynvim_pp.rpc import RpcCallable, RpcMsg, nil_handler
+from pynvim_pp.rpc import RpcCallable, RpcMsg, RpcSpec, nil_handler
 from std2.pickle import DecodeError
-from std2.sched import ticker
 from std2.types import AnyFun
 
 from ._registry import ____
 from .consts import RENDER_RETRIES
-from .registry import autocmd, enqueue_event, event_queue, pool, rpc
+from .fs.types import Node
+from .metrics import attribute, frame_stats, timed
+from .polling import Poll, poller
+from .registry import (
+    autocmd,
+    enqueue_event,
+    event_queue,
+    is_background,
+    is_quiet,
+    pool,
+    rpc,
+)
 from .settings.load import initial as initial_settings
 from .settings.localization import init as init_locale
 from .settings.types import Settings
 from .state.load import initial as initial_state
+from .state.next import forward
 from .state.types import State
+from .trace import emit, enable, trace_path
 from .transitions.autocmds import save_session
-from .transitions.redraw import redraw
+from .transitions.redraw import Plan, prepare, redraw
+from .transitions.reload import reload
 from .transitions.schedule_update import schedule_update
+from .transitions.shared.dormant import asleep
+from .transitions.shared.wm import forget_layout
 from .transitions.types import Stage
 from .transitions.version_ctl import vc_refresh
 
 
-def _profile(nvim: Nvim, t1: float) -> None:
+def _profile(nvim: Nvim, imported: float, t1: float) -> None:
     t2 = monotonic()
     info = uname()
     msg = f"""
+    Imports    {int(imported * 1000)}ms
     First msg  {int((t2 - t1) * 1000)}ms
     Arch       {info.machine}
     Processor  {info.processor}
@@ -49,11 +73,58 @@ def _profile(nvim: Nvim, t1: float) -> None:
     write(nvim, dedent(msg))
 
 
+def _drain() -> Sequence[RpcMsg]:
+    """
+    Block for the first event, then take whatever else has piled up
+    """
+
+    msgs: MutableSequence[RpcMsg] = [event_queue.get()]
+    while True:
+        try:
+            msgs.append(event_queue.get_nowait())
+        except Empty:
+            return msgs
+
+
 class ChadClient(Client):
-    def __init__(self) -> None:
+    def __init__(self, imported: float = 0) -> None:
+        self._imported = imported
         self._handlers: MutableMapping[str, RpcCallable] = {}
+        self._specs: Sequence[RpcSpec] = ()
         self._state: Optional[State] = None
         self._settings: Optional[Settings] = None
+        self._root: Optional[Node] = None
+        self._prepared: Optional[State] = None
+
+    def _prepare(self, nvim: Nvim, state: State, settings: Settings) -> Plan:
+        """
+        Walks & renders are lazy, so they fail here, not in the handler
+
+        -> A failed walk falls back to the last good root, a failed render to the
+        last state that rendered, neither is left in `self._state`
+        """
+
+        try:
+            self._root = state.root
+        except Exception as e:
+            log.exception("%s", e)
+            threadsafe_call(nvim, write, nvim, e, error=True)
+            if self._root:
+                state = forward(state, settings=settings, root=self._root)
+            else:
+                raise
+
+        try:
+            plan = prepare(state)
+        except Exception as e:
+            log.exception("%s", e)
+            threadsafe_call(nvim, write, nvim, e, error=True)
+            if self._prepared:
+                self._state = self._prepared
+            raise
+        else:
+            self._state = self._prepared = state
+            return plan
 
     def on_msg(self, nvim: Nvim, msg: RpcMsg) -> Any:
         event_queue.put(msg)
@@ -66,6 +137,7 @@ class ChadClient(Client):
 
             atomic, specs = rpc.drain(nvim.channel_id)
             self._handlers.update(specs)
+            self._specs = specs
             try:
                 self._settings = initial_settings(nvim, specs)
             except DecodeError as e:
@@ -74,8 +146,7 @@ class ChadClient(Client):
                 write(nvim, e, msg1, msg2, sep=linesep, error=True)
                 return False
             else:
-                hl = highlight(*self._settings.view.hl_context.groups)
-                (atomic + autocmd.drain() + hl).commit(nvim)
+                (atomic + autocmd.drain()).commit(nvim)
 
                 self._state = initial_state(nvim, settings=self._settings)
                 init_locale(self._settings.lang)
@@ -91,45 +162,115 @@ class ChadClient(Client):
                 return 1
             else:
                 settings = cast(Settings, self._settings)
+                if settings.trace:
+                    enable(trace_path(use_xdg=settings.xdg))
                 t1, has_drawn = monotonic(), False
 
+        polls = {
+            Poll.fs: schedule_update,
+            Poll.vc: vc_refresh,
+            Poll.session: save_session,
+        }
+
         def sched() -> None:
             enqueue_event(vc_refresh)
-            for _ in ticker(settings.polling_rate, immediately=False):
-                enqueue_event(schedule_update)
-                enqueue_event(vc_refresh)
-                enqueue_event(save_session)
+            poller.run(settings.polling, fire=lambda poll: enqueue_event(polls[poll]))
 
         pool.submit(sched)
 
         while True:
-            msg: RpcMsg = event_queue.get()
-            name, (args, *_) = msg
-            handler = cast(
-                AnyFun[Optional[Stage]], self._handlers.get(name, nil_handler(name))
-            )
+            msgs = _drain()
+            frame_start = perf_counter()
+
+            def handle() -> Tuple[int, Optional[str], Optional[PurePath]]:
+                nonlocal settings
+
+                stages = 0
+                last: Optional[str] = None
+                focus: Optional[PurePath] = None
 
-            def cdraw() -> None:
-                nonlocal has_drawn
-                stage = handler(nvim, self._state, settings, *args)
-                if stage:
-                    self._state = stage.state
-
-                    for _ in range(RENDER_RETRIES - 1):
-                        try:
-                            redraw(nvim, state=self._state, focus=stage.focus)
-                        except NvimError as e:
-                            write(nvim, f"recoverable error - {e}")
-                        else:
-                            break
+                for name, (args, *_) in msgs:
+                    handler = cast(
+                        AnyFun[Optional[Stage]],
+                        self._handlers.get(name, nil_handler(name)),
+                    )
+                    try:
+                        with attribute(name), timed("handler"):
+                            stage = handler(nvim, self._state, settings, *args)
+                    except Exception as e:
+                        log.exception("%s", e)
                     else:
-                        redraw(nvim, state=self._state, focus=stage.focus)
+                        if not is_background(name):
+                            if not is_quiet(name):
+                                poller.poke()
+                            # might have opened or closed windows
+                            forget_layout()
+                        if stage:
+                            stages += 1
+                            last = name
+                            self._state = stage.state
+                            focus = stage.focus or focus
+                            if stage.reload:
+                                self._state, settings = reload(
+                                    nvim,
+                                    state=self._state,
+                                    prev=settings,
+                                    specs=self._specs,
+                                )
+                                self._settings = settings
 
-                    if settings.profiling and not has_drawn:
-                        has_drawn = True
-                        _profile(nvim, t1=t1)
+                return stages, last, focus
 
             try:
-                threadsafe_call(nvim, cdraw)
+                stages, last, focus = threadsafe_call(nvim, handle)
+                frame_stats.events += len(msgs)
+
+                if stages and last and self._state and not asleep():
+                    frame_stats.frames += 1
+                    frame_stats.coalesced += stages - 1
+                    # charged to whichever event the final state came from
+                    event = last
+                    # walk, render & diff here, leave `nvim` to the UI
+                    with attribute(event):
+                        plan = self._prepare(nvim, state=self._state, settings=settings)
+                    if is_background(event) and any(
+                        trans for _, trans in plan.trans.values()
+                    ):
+                        # a poll turned something up, more is likely on the way
+                        poller.poke()
+
+                    def cdraw() -> None:
+                        nonlocal has_drawn
+
+                        with attribute(event):
+                            for _ in range(RENDER_RETRIES - 1):
+                                try:
+                                    redraw(
+                                        nvim, plan=plan, settings=settings, focus=focus
+                                    )
+                                except NvimError as e:
+                                    write(nvim, f"recoverable error - {e}")
+                                else:
+                                    break
+                            else:
+                                redraw(nvim, plan=plan, settings=settings, focus=focus)
+
+                        if settings.profiling and not has_drawn:
+                            has_drawn = True
+                            _profile(nvim, imported=self._imported, t1=t1)
+
+                    threadsafe_call(nvim, cdraw)
             except Exception as e:
                 log.exception("%s", e)
+
+            elapsed = perf_counter() - frame_start
+            frame_time = 1 / settings.max_fps if settings.max_fps > 0 else 0
+            emit(
+                "frame",
+                cat="client",
+                start=frame_start,
+                elapsed=elapsed,
+                args={"events": len(msgs)},
+            )
+            if elapsed < frame_time:
+                sleep(frame_time - elapsed)
@@ -6,6 +6,13 @@ from chad_types import TOP_LEVEL
 RENDER_RETRIES = 3
 
 WALK_PARALLELISM_FACTOR = 100
+COLLATION_CACHE_SIZE = 2 ** 16
+METRICS_SAMPLES = 1000
+TRACE_MAX_BYTES = 64 * 2 ** 20
+LSP_NOTIFY_CHUNK = 500
+FS_JOB_WORKERS = 2
+FS_COPY_CHUNK = 2 ** 20
+JOB_PROGRESS_INTERVAL = 0.25
 FOLDER_MODE = 0o755
 FILE_MODE = 0o644
 
@@ -30,12 +37,16 @@ RT_PY = (
     RT_DIR / "Scripts" / "python.exe" if name == "nt" else RT_DIR / "bin" / "python3"
 )
 SESSION_DIR = _VARS / "sessions"
+CACHE_DIR = _VARS / "cache"
+TRACE_DIR = _VARS / "traces"
 
 _XDG_DATA_DIR = Path(environ.get("XDG_DATA_HOME", _VARS))
 _XDG_VARS = _XDG_DATA_DIR / "nvim" / "chadtree"
 RT_DIR_XDG = _XDG_VARS / "runtime"
 RT_PY_XDG = RT_DIR_XDG / "bin" / "python3"
 SESSION_DIR_XDG = _XDG_VARS / "sessions"
+CACHE_DIR_XDG = _XDG_VARS / "cache"
+TRACE_DIR_XDG = _XDG_VARS / "traces"
 
 """
 Docs
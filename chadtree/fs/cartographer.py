@@ -28,6 +28,7 @@ from typing import (
 from std2.itertools import chunk
 
 from ..consts import WALK_PARALLELISM_FACTOR
+from ..metrics import timed
 from ..registry import pool
 from ..state.types import Index
 from .ops import ancestors
@@ -136,6 +137,7 @@ def _join(nodes: SimpleQueue) -> Node:
         return root_node
 
 
+@timed("walk")
 def new(root: PurePath, index: Index) -> Node:
     acc: SimpleQueue = SimpleQueue()
     bfs_q: SimpleQueue = SimpleQueue()
@@ -155,12 +157,20 @@ def new(root: PurePath, index: Index) -> Node:
     return _join(acc)
 
 
-def _update(root: Node, index: Index, paths: AbstractSet[PurePath]) -> Node:
+def _update(
+    root: Node,
+    index: Index,
+    paths: AbstractSet[PurePath],
+    affected: AbstractSet[PurePath],
+) -> Node:
     if root.path in paths:
         return new(root.path, index=index)
+    elif root.path not in affected:
+        return root
     else:
         children = {
-            k: _update(v, index=index, paths=paths) for k, v in root.children.items()
+            k: _update(v, index=index, paths=paths, affected=affected)
+            for k, v in root.children.items()
         }
         return Node(
             path=root.path,
@@ -170,13 +180,31 @@ def _update(root: Node, index: Index, paths: AbstractSet[PurePath]) -> Node:
         )
 
 
+@timed("walk")
 def update(root: Node, *, index: Index, paths: AbstractSet[PurePath]) -> Node:
+    """
+    Untouched subtrees are shared with the previous tree
+    """
+
+    affected = {ancestor for path in paths for ancestor in ancestors(path)}
     try:
-        return _update(root, index=index, paths=paths)
+        return _update(root, index=index, paths=paths, affected=affected)
     except FileNotFoundError:
         return new(root.path, index=index)
 
 
+def find(root: Node, path: PurePath) -> Optional[Node]:
+    try:
+        rel = path.relative_to(root.path)
+    except ValueError:
+        return None
+    else:
+        node: Optional[Node] = root
+        for part in rel.parts:
+            node = node.children.get(node.path / part) if node else None
+        return node
+
+
 def is_dir(node: Node) -> bool:
     return Mode.folder in node.mode
 
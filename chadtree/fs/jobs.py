@@ -0,0 +1,125 @@
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from itertools import count
+from pathlib import PurePath
+from threading import Event, Lock
+from typing import AbstractSet, Callable, MutableMapping, Optional, Sequence, Tuple
+
+from ..consts import FS_JOB_WORKERS
+
+
+class Cancelled(Exception):
+    """
+    Not an `OSError`, so `copytree` & friends do not swallow it
+    """
+
+
+class Progress:
+    """
+    Written to by the job, read by whoever draws it
+    """
+
+    def __init__(self) -> None:
+        self._lock = Lock()
+        self._cancelled = Event()
+        self._total: Tuple[int, int] = (0, 0)
+        self._done: Tuple[int, int] = (0, 0)
+
+    def expect(self, files: int, nbytes: int) -> None:
+        with self._lock:
+            self._total = (files, nbytes)
+
+    def advance(self, files: int = 0, nbytes: int = 0) -> None:
+        """
+        Every unit of work goes through here, so this is where cancellation lands
+        """
+
+        if self._cancelled.is_set():
+            raise Cancelled()
+        else:
+            with self._lock:
+                done_files, done_bytes = self._done
+                self._done = (done_files + files, done_bytes + nbytes)
+
+    def cancel(self) -> None:
+        self._cancelled.set()
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancelled.is_set()
+
+    def report(self) -> Tuple[Tuple[int, int], Tuple[int, int]]:
+        """
+        -> (files, bytes) done, (files, bytes) total
+        """
+
+        with self._lock:
+            return self._done, self._total
+
+
+@dataclass(frozen=True)
+class Job:
+    uid: int
+    name: str
+    paths: AbstractSet[PurePath]
+    progress: Progress
+
+
+_executor = ThreadPoolExecutor(max_workers=FS_JOB_WORKERS)
+_lock = Lock()
+_uids = count()
+_jobs: MutableMapping[int, Job] = {}
+
+
+def _overlaps(lhs: AbstractSet[PurePath], rhs: AbstractSet[PurePath]) -> bool:
+    """
+    Same path, or one inside of the other
+    """
+
+    return any(a == b or a in b.parents or b in a.parents for a in lhs for b in rhs)
+
+
+def submit(
+    name: str,
+    paths: AbstractSet[PurePath],
+    run: Callable[[Progress], None],
+    done: Callable[[Job, Optional[Exception]], None],
+) -> Optional[Job]:
+    """
+    `done` is called from the executor, after the job is no longer `running()`
+
+    -> `None` if `paths`, sources & destinations, overlap those of a running job
+    """
+
+    job = Job(uid=next(_uids), name=name, paths=paths, progress=Progress())
+    with _lock:
+        if any(_overlaps(paths, other.paths) for other in _jobs.values()):
+            return None
+        else:
+            _jobs[job.uid] = job
+
+    def cont() -> None:
+        error: Optional[Exception] = None
+        try:
+            run(job.progress)
+        except Exception as e:
+            error = e
+        finally:
+            with _lock:
+                _jobs.pop(job.uid, None)
+        done(job, error)
+
+    _executor.submit(cont)
+    return job
+
+
+def running() -> Sequence[Job]:
+    with _lock:
+        return tuple(_jobs.values())
+
+
+def cancel_all() -> Sequence[Job]:
+    jobs = running()
+    for job in jobs:
+        job.progress.cancel()
+    return jobs
@@ -1,19 +1,22 @@
 from dataclasses import dataclass
 from datetime import datetime
+from functools import partial
 from os import makedirs
 from os import name as os_name
 from os import readlink
 from os import remove as rm
-from os import stat
+from os import rmdir, stat, walk
+from os.path import islink, join
 from pathlib import Path, PurePath
-from shutil import copy2, copytree
+from shutil import copy2, copystat, copytree
 from shutil import move as mv
 from shutil import rmtree
 from stat import S_ISDIR, S_ISLNK, filemode
-from typing import AbstractSet, Iterable, Mapping, Optional
+from typing import AbstractSet, Iterable, Mapping, Optional, Tuple
 
-from ..consts import FILE_MODE, FOLDER_MODE
+from ..consts import FILE_MODE, FOLDER_MODE, FS_COPY_CHUNK
 from ..registry import pool
+from .jobs import Cancelled, Progress
 
 
 def ancestors(path: PurePath) -> AbstractSet[PurePath]:
@@ -115,7 +118,44 @@ def rename(operations: Mapping[PurePath, PurePath]) -> None:
     tuple(pool.map(_op, operations.items()))
 
 
-def _remove(path: PurePath) -> None:
+def _measure(path: PurePath, follow: bool, links: bool) -> Tuple[int, int]:
+    """
+    -> (files, bytes), an estimate, the tree can change under us
+
+    -> `follow` like `copytree(symlinks=False)` does into linked folders
+
+    -> `links` if symlinks to files are counted, ie. not just recreated
+    """
+
+    stats = stat(path, follow_symlinks=False)
+    if not S_ISDIR(stats.st_mode):
+        return 1, stats.st_size
+    else:
+        files, nbytes = 0, 0
+        for root, _, names in walk(path, followlinks=follow):
+            for name in names:
+                file = join(root, name)
+                if links or not islink(file):
+                    try:
+                        size = stat(file).st_size
+                    except OSError:
+                        size = 0
+                    files, nbytes = files + 1, nbytes + size
+        return files, nbytes
+
+
+def _expect(progress: Progress, sizes: Iterable[Tuple[int, int]]) -> None:
+    files, nbytes = 0, 0
+    for f, b in sizes:
+        files, nbytes = files + f, nbytes + b
+    progress.expect(files, nbytes=nbytes)
+
+
+def _raise(e: OSError) -> None:
+    raise e
+
+
+def _rm(path: PurePath) -> None:
     stats = stat(path, follow_symlinks=False)
     if S_ISDIR(stats.st_mode):
         rmtree(path)
@@ -123,28 +163,108 @@ def _remove(path: PurePath) -> None:
         rm(path)
 
 
-def remove(paths: Iterable[PurePath]) -> None:
-    tuple(pool.map(_remove, paths))
+def _discard(dest: PurePath) -> None:
+    """
+    Half a copy is worse than none, `dest` did not exist before the job
+    """
 
+    if exists(dest, follow=False):
+        _rm(dest)
 
-def _cut(src: PurePath, dest: PurePath) -> None:
-    mv(str(src), str(dest))
 
+def _remove(path: PurePath, progress: Progress) -> None:
+    stats = stat(path, follow_symlinks=False)
+    if S_ISDIR(stats.st_mode):
+        for root, dirs, names in walk(path, topdown=False, onerror=_raise):
+            for name in names:
+                rm(join(root, name))
+                progress.advance(files=1)
+            for name in dirs:
+                sub = join(root, name)
+                if islink(sub):
+                    rm(sub)
+                else:
+                    rmdir(sub)
+        rmdir(path)
+    else:
+        rm(path)
+        progress.advance(files=1)
 
-def cut(operations: Mapping[PurePath, PurePath]) -> None:
-    _op = lambda op: _cut(*op)
-    tuple(pool.map(_op, operations.items()))
 
+def remove(paths: Iterable[PurePath], progress: Progress) -> None:
+    paths = tuple(paths)
+    sizes = (_measure(path, follow=False, links=True) for path in paths)
+    _expect(progress, sizes=((files, 0) for files, _ in sizes))
+    for path in paths:
+        _remove(path, progress=progress)
 
-def _copy(src: PurePath, dest: PurePath) -> None:
-    stats = stat(src, follow_symlinks=False)
-    if S_ISDIR(stats.st_mode):
-        copytree(src, dest)
-    else:
-        copy2(src, dest, follow_symlinks=False)
 
+def _copy_file(src: str, dst: str, progress: Progress) -> str:
+    """
+    `copy2`, but in chunks, so that progress is reported & cancellation is prompt
+    """
+
+    with open(src, "rb") as s, open(dst, "wb") as d:
+        for chunk in iter(lambda: s.read(FS_COPY_CHUNK), b""):
+            d.write(chunk)
+            progress.advance(nbytes=len(chunk))
+    copystat(src, dst)
+    progress.advance(files=1)
+    return dst
+
+
+def _same_device(src: PurePath, dest: PurePath) -> bool:
+    return stat(src, follow_symlinks=False).st_dev == stat(dest.parent).st_dev
 
-def copy(operations: Mapping[PurePath, PurePath]) -> None:
-    _op = lambda op: _copy(*op)
-    tuple(pool.map(_op, operations.items()))
 
+def _cut(src: PurePath, dest: PurePath, progress: Progress, rename: bool) -> None:
+    if rename:
+        mv(str(src), str(dest))
+        progress.advance(files=1)
+    else:
+        copy_function = partial(_copy_file, progress=progress)
+        try:
+            mv(str(src), str(dest), copy_function=copy_function)
+        except Cancelled:
+            # `src` is only removed after it has been copied in full
+            _discard(dest)
+            raise
+
+
+def cut(operations: Mapping[PurePath, PurePath], progress: Progress) -> None:
+    # `move` recreates symlinks without `copy_function`, so they count as renames
+    renames = {
+        src: islink(src) or _same_device(src, dest) for src, dest in operations.items()
+    }
+    _expect(
+        progress,
+        sizes=(
+            (1, 0) if renames[src] else _measure(src, follow=False, links=False)
+            for src in operations
+        ),
+    )
+    for src, dest in operations.items():
+        _cut(src, dest, progress=progress, rename=renames[src])
+
+
+def _copy(src: PurePath, dest: PurePath, progress: Progress) -> None:
+    copy_function = partial(_copy_file, progress=progress)
+    stats = stat(src, follow_symlinks=False)
+    try:
+        if S_ISDIR(stats.st_mode):
+            copytree(src, dest, copy_function=copy_function)
+        elif S_ISLNK(stats.st_mode):
+            copy2(src, dest, follow_symlinks=False)
+            progress.advance(files=1)
+        else:
+            copy_function(str(src), str(dest))
+    except Cancelled:
+        _discard(dest)
+        raise
+
+
+def copy(operations: Mapping[PurePath, PurePath], progress: Progress) -> None:
+    sizes = (_measure(src, follow=True, links=True) for src in operations)
+    _expect(progress, sizes=sizes)
+    for src, dest in operations.items():
+        _copy(src, dest, progress=progress)
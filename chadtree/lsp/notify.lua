@@ -1,10 +1,51 @@
 (function (args)
-  local method, params = unpack(args)
-  if vim.lsp then
-    local clients = vim.lsp.get_active_clients()
-    for _, client in ipairs(clients) do
-      client.notify(method, params)
+  local method, capability, files = unpack(args)
+  if not vim.lsp then
+    return
+  end
+
+  local compiled = {}
+  local regex = function(glob, ignore_case)
+    local key = (ignore_case and "i" or "c") .. glob
+    local re = compiled[key]
+    if not re then
+      local prefix = ignore_case and [[\c]] or [[\C]]
+      re = vim.regex(prefix .. vim.fn.glob2regpat(glob))
+      compiled[key] = re
     end
+    return re
   end
-end)(...)
 
+  local matches = function(filters, file)
+    for _, filter in ipairs(filters) do
+      local pattern = filter.pattern or {}
+      local scheme_ok = not filter.scheme or filter.scheme == "file"
+      local kind_ok = not pattern.matches or not file.kind or
+        pattern.matches == file.kind
+      if scheme_ok and kind_ok and pattern.glob then
+        local ignore_case = pattern.options and pattern.options.ignoreCase
+        if regex(pattern.glob, ignore_case):match_str(file.path) then
+          return true
+        end
+      end
+    end
+    return false
+  end
+
+  for _, client in ipairs(vim.lsp.get_active_clients()) do
+    local caps = client.server_capabilities or {}
+    local ops = (caps.workspace or {}).fileOperations or {}
+    local registration = ops[capability]
+    if registration then
+      local selected = {}
+      for _, file in ipairs(files) do
+        if matches(registration.filters or {}, file) then
+          table.insert(selected, file.params)
+        end
+      end
+      if #selected > 0 then
+        client.notify(method, {files = selected})
+      end
+    end
+  end
+end)(...)
@@ -1,31 +1,100 @@
+from os.path import isdir
 from pathlib import Path, PurePath
-from typing import Any, Iterable, Mapping
+from typing import Any, Callable, Iterable, Iterator, Mapping, Optional, Sequence
 
 from pynvim import Nvim
+from pynvim_pp.lib import threadsafe_call
+from pynvim_pp.logging import log
+
+from ..consts import LSP_NOTIFY_CHUNK
+from ..registry import pool
 
 _LUA = (Path(__file__).resolve().parent / "notify.lua").read_text("UTF-8")
 
+_File = Mapping[str, Any]
+
+
+def _kind(path: PurePath) -> str:
+    return "folder" if isdir(path) else "file"
+
+
+def _file(path: PurePath, kind: Optional[str], params: Mapping[str, str]) -> _File:
+    """
+    Servers may only want files, or only folders, a deleted path could be either
+    """
+
+    file = {"path": str(path), "params": params}
+    return {**file, "kind": kind} if kind else file
+
+
+def _chunked(files: Sequence[_File]) -> Iterator[Sequence[_File]]:
+    for idx in range(0, len(files), LSP_NOTIFY_CHUNK):
+        yield files[idx : idx + LSP_NOTIFY_CHUNK]
+
+
+def _notify(
+    nvim: Nvim, method: str, capability: str, files: Callable[[], Sequence[_File]]
+) -> None:
+    """
+    URIs are built off the `nvim` thread, and sent without waiting on a reply
 
-def _notify(nvim: Nvim, method: str, params: Any) -> None:
-    nvim.funcs.luaeval(_LUA, (method, params))
+    -> Each client only gets the files its `capability` filters ask for
+    """
+
+    def cont() -> None:
+        def c1(chunk: Sequence[_File]) -> None:
+            nvim.funcs.luaeval(_LUA, (method, capability, chunk), async_=True)
+
+        try:
+            for chunk in _chunked(files()):
+                threadsafe_call(nvim, c1, chunk)
+        except Exception as e:
+            log.exception("%s", e)
+
+    pool.submit(cont)
 
 
 def lsp_created(nvim: Nvim, paths: Iterable[PurePath]) -> None:
-    params = {"files": tuple({"uri": path.as_uri()} for path in paths)}
-    _notify(nvim, method="workspace/didCreateFiles", params=params)
+    created = tuple(paths)
+
+    def files() -> Sequence[_File]:
+        return tuple(
+            _file(path, kind=_kind(path), params={"uri": path.as_uri()})
+            for path in created
+        )
+
+    _notify(
+        nvim, method="workspace/didCreateFiles", capability="didCreate", files=files
+    )
 
 
 def lsp_removed(nvim: Nvim, paths: Iterable[PurePath]) -> None:
-    params = {"files": tuple({"uri": path.as_uri()} for path in paths)}
-    _notify(nvim, method="workspace/didDeleteFiles", params=params)
+    removed = tuple(paths)
+
+    def files() -> Sequence[_File]:
+        return tuple(
+            _file(path, kind=None, params={"uri": path.as_uri()}) for path in removed
+        )
+
+    _notify(
+        nvim, method="workspace/didDeleteFiles", capability="didDelete", files=files
+    )
 
 
 def lsp_moved(nvim: Nvim, paths: Mapping[PurePath, PurePath]) -> None:
-    params = {
-        "files": tuple(
-            {"oldUri": old.as_uri(), "newUri": new.as_uri()}
-            for old, new in paths.items()
+    moved = tuple(paths.items())
+
+    def files() -> Sequence[_File]:
+        # filters match on the old path, which is gone by now
+        return tuple(
+            _file(
+                old,
+                kind=_kind(new),
+                params={"oldUri": old.as_uri(), "newUri": new.as_uri()},
+            )
+            for old, new in moved
         )
-    }
-    _notify(nvim, method="workspace/didRenameFiles", params=params)
 
+    _notify(
+        nvim, method="workspace/didRenameFiles", capability="didRename", files=files
+    )
@@ -0,0 +1,128 @@
+from collections import deque
+from contextlib import contextmanager
+from dataclasses import dataclass
+from threading import Lock, local
+from time import perf_counter
+from typing import (
+    Deque,
+    Iterator,
+    MutableMapping,
+    MutableSet,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+from .consts import METRICS_SAMPLES
+from .trace import emit
+
+_UNATTRIBUTED = "-"
+
+
+@dataclass
+class FrameStats:
+    frames: int = 0
+    events: int = 0
+    coalesced: int = 0
+
+
+@dataclass(frozen=True)
+class Summary:
+    event: str
+    phase: str
+    count: int
+    p50: float
+    p95: float
+    max: float
+
+
+class _Ctx(local):
+    event: Optional[str] = None
+
+    def __init__(self) -> None:
+        self.phases: MutableSet[str] = set()
+
+
+_ctx = _Ctx()
+_lock = Lock()
+_samples: MutableMapping[Tuple[str, str], Deque[float]] = {}
+_counts: MutableMapping[Tuple[str, str], int] = {}
+
+frame_stats = FrameStats()
+
+
+@contextmanager
+def attribute(event: str) -> Iterator[None]:
+    """
+    Phases timed on this thread are charged to `event`
+    """
+
+    prev, _ctx.event = _ctx.event, event
+    try:
+        yield None
+    finally:
+        _ctx.event = prev
+
+
+def _label(event: Optional[str]) -> str:
+    return event or _ctx.event or _UNATTRIBUTED
+
+
+def record(phase: str, elapsed: float, event: Optional[str] = None) -> None:
+    key = _label(event), phase
+    with _lock:
+        samples = _samples.get(key)
+        if samples is None:
+            samples = _samples[key] = deque(maxlen=METRICS_SAMPLES)
+        samples.append(elapsed)
+        _counts[key] = _counts.get(key, 0) + 1
+
+
+@contextmanager
+def timed(phase: str, event: Optional[str] = None) -> Iterator[None]:
+    """
+    Only the outermost `phase` on a thread counts, so nested walks are not double billed
+    """
+
+    if phase in _ctx.phases:
+        yield None
+    else:
+        _ctx.phases.add(phase)
+        label = _label(event)
+        t1 = perf_counter()
+        try:
+            yield None
+        finally:
+            elapsed = perf_counter() - t1
+            _ctx.phases.discard(phase)
+            record(phase, elapsed=elapsed, event=label)
+            emit(phase, cat=label, start=t1, elapsed=elapsed)
+
+
+def _percentile(ordered: Sequence[float], q: float) -> float:
+    idx = min(len(ordered) - 1, int(q * len(ordered)))
+    return ordered[idx]
+
+
+def summaries() -> Sequence[Summary]:
+    """
+    Percentiles are over the last `METRICS_SAMPLES` samples, counts are for all time
+    """
+
+    with _lock:
+        snapshot = tuple((key, tuple(samples)) for key, samples in _samples.items())
+        counts = {**_counts}
+
+    def cont() -> Iterator[Summary]:
+        for (event, phase), samples in sorted(snapshot):
+            ordered = sorted(samples)
+            yield Summary(
+                event=event,
+                phase=phase,
+                count=counts[event, phase],
+                p50=_percentile(ordered, 0.5),
+                p95=_percentile(ordered, 0.95),
+                max=ordered[-1],
+            )
+
+    return tuple(cont())
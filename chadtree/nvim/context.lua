@@ -0,0 +1,14 @@
+(function ()
+  local win = vim.api.nvim_get_current_win()
+  local buf = vim.api.nvim_win_get_buf(win)
+  return {
+    win,
+    buf,
+    vim.api.nvim_buf_get_option(buf, "filetype"),
+    vim.api.nvim_win_get_cursor(win),
+    vim.api.nvim_buf_get_mark(buf, "<"),
+    vim.api.nvim_buf_get_mark(buf, ">"),
+    vim.fn.getcwd(),
+    vim.api.nvim_buf_get_name(buf)
+  }
+end)()
@@ -0,0 +1,25 @@
+from pathlib import Path, PurePath
+
+from pynvim import Nvim
+
+from .types import EditorCtx
+
+_LUA = (Path(__file__).resolve().parent / "context.lua").read_text("UTF-8")
+
+
+def editor_ctx(nvim: Nvim) -> EditorCtx:
+    """
+    Everything a keypress needs to know about the editor, in a single round trip
+    """
+
+    ctx = nvim.funcs.luaeval(_LUA)
+    win, buf, filetype, (row, col), (r1, c1), (r2, c2), cwd, name = ctx
+    return EditorCtx(
+        win=win,
+        buf=buf,
+        filetype=filetype,
+        cursor=(row - 1, col),
+        marks=((r1 - 1, c1), (r2 - 1, c2)),
+        cwd=PurePath(cwd),
+        buf_name=PurePath(name),
+    )
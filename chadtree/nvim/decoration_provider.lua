@@ -0,0 +1,93 @@
+(function (args)
+  local buf, ns, groups, hunks = unpack(args)
+  local set_extmark = vim.api.nvim_buf_set_extmark
+
+  chad = chad or {}
+  local decor = chad.decorations or {bufs = {}, registered = false}
+  chad.decorations = decor
+
+  if not decor.registered then
+    decor.registered = true
+    vim.api.nvim_set_decoration_provider(
+      ns,
+      {
+        on_win = function(_, _, bufnr)
+          return decor.bufs[bufnr] ~= nil
+        end,
+        on_line = function(_, _, bufnr, row)
+          local rows = decor.bufs[bufnr]
+          local entry = rows and rows[row + 1]
+          if entry then
+            local hls, virt_text = entry[1], entry[2]
+            for i = 1, #hls, 3 do
+              set_extmark(
+                bufnr,
+                ns,
+                row,
+                hls[i],
+                {end_col = hls[i + 1], hl_group = hls[i + 2], ephemeral = true}
+              )
+            end
+            if #virt_text > 0 then
+              set_extmark(
+                bufnr,
+                ns,
+                row,
+                0,
+                {virt_text = virt_text, ephemeral = true}
+              )
+            end
+          end
+        end
+      }
+    )
+  end
+
+  for bufnr, _ in pairs(decor.bufs) do
+    if not vim.api.nvim_buf_is_valid(bufnr) then
+      decor.bufs[bufnr] = nil
+    end
+  end
+
+  local resolve = function(row)
+    local p_hls, p_badges = row[1], row[2]
+    local hls, virt_text = {}, {}
+    for i = 1, #p_hls, 3 do
+      table.insert(hls, p_hls[i])
+      table.insert(hls, p_hls[i + 1])
+      table.insert(hls, groups[p_hls[i + 2]])
+    end
+    for i = 1, #p_badges, 2 do
+      table.insert(virt_text, {p_badges[i], groups[p_badges[i + 1]]})
+    end
+    return {hls, virt_text}
+  end
+
+  local empty = {{}, {}}
+  local old, new = decor.bufs[buf] or {}, {}
+  local n, src, offset = 0, 0, 0
+
+  for _, hunk in ipairs(hunks) do
+    local i1, i2, rows = hunk[1], hunk[2], hunk[3]
+    for k = src + 1, i1 - offset do
+      n = n + 1
+      new[n] = old[k] or empty
+    end
+    for _, row in ipairs(rows) do
+      n = n + 1
+      new[n] = resolve(row)
+    end
+    src = i2 - offset
+    offset = offset + #rows - (i2 - i1)
+  end
+  for k = src + 1, #old do
+    n = n + 1
+    new[n] = old[k]
+  end
+
+  local line_count = vim.api.nvim_buf_line_count(buf)
+  for k = line_count + 1, n do
+    new[k] = nil
+  end
+  decor.bufs[buf] = new
+end)(...)
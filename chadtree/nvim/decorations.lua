@@ -0,0 +1,36 @@
+(function (args)
+  local buf, ns, groups, highlights, badges = unpack(args)
+  local set_extmark = vim.api.nvim_buf_set_extmark
+
+  for i = 1, #highlights, 4 do
+    local row, col_start, col_end, gid =
+      highlights[i],
+      highlights[i + 1],
+      highlights[i + 2],
+      highlights[i + 3]
+    set_extmark(
+      buf,
+      ns,
+      row,
+      col_start,
+      {end_col = col_end, hl_group = groups[gid]}
+    )
+  end
+
+  local virt_row, virt_text = nil, {}
+  local flush = function()
+    if virt_row then
+      set_extmark(buf, ns, virt_row, 0, {virt_text = virt_text})
+    end
+  end
+
+  for i = 1, #badges, 3 do
+    local row, text, gid = badges[i], badges[i + 1], badges[i + 2]
+    if row ~= virt_row then
+      flush()
+      virt_row, virt_text = row, {}
+    end
+    table.insert(virt_text, {text, groups[gid]})
+  end
+  flush()
+end)(...)
@@ -0,0 +1,103 @@
+from pathlib import Path
+from typing import (
+    Any,
+    Callable,
+    Iterable,
+    Iterator,
+    MutableMapping,
+    MutableSequence,
+    Sequence,
+    Tuple,
+    Union,
+)
+
+from pynvim import Nvim
+from pynvim.api import Buffer
+from pynvim_pp.atomic import Atomic
+
+from ..view.types import Badge, Highlight
+
+_PARENT = Path(__file__).resolve().parent
+_LUA = (_PARENT / "decorations.lua").read_text("UTF-8")
+_LUA_PROVIDER = (_PARENT / "decoration_provider.lua").read_text("UTF-8")
+_FORGET_PROVIDED = """
+if chad and chad.decorations then
+  chad.decorations.bufs = {}
+end
+"""
+
+Decorations = Tuple[int, Sequence[Highlight], Sequence[Badge]]
+Hunk = Tuple[int, int, Sequence[Tuple[Sequence[Highlight], Sequence[Badge]]]]
+
+
+def _interned() -> Tuple[MutableMapping[str, int], Callable[[str], int]]:
+    groups: MutableMapping[str, int] = {}
+
+    def group_id(group: str) -> int:
+        return groups.setdefault(group, len(groups) + 1)
+
+    return groups, group_id
+
+
+def decorate(
+    atomic: Atomic, buf: Buffer, ns: int, decorations: Iterable[Decorations]
+) -> None:
+    """
+    -> [row, col_start, col_end, group_id, ...], [row, text, group_id, ...]
+    """
+
+    groups, group_id = _interned()
+    highlights: MutableSequence[int] = []
+    badges: MutableSequence[Union[int, str]] = []
+
+    for row, hls, bdgs in decorations:
+        for hl in hls:
+            highlights.extend((row, hl.begin, hl.end, group_id(hl.group)))
+        for bdg in bdgs:
+            badges.extend((row, bdg.text, group_id(bdg.group)))
+
+    if highlights or badges:
+        args = (buf.number, ns, tuple(groups), highlights, badges)
+        atomic.call_function("luaeval", (_LUA, args))
+
+
+def provide_decorations(
+    atomic: Atomic, buf: Buffer, ns: int, hunks: Iterable[Hunk]
+) -> None:
+    """
+    Splice the per row tables kept in lua, same as the `buf_set_lines` calls
+
+    -> [i1, i2, [[col_start, col_end, group_id, ...], [text, group_id, ...]], ...]
+    """
+
+    groups, group_id = _interned()
+
+    def cont() -> Iterator[Tuple[int, int, Sequence[Any]]]:
+        for i1, i2, rows in hunks:
+            decors = tuple(
+                (
+                    tuple(
+                        val
+                        for hl in hls
+                        for val in (hl.begin, hl.end, group_id(hl.group))
+                    ),
+                    tuple(
+                        val for bdg in bdgs for val in (bdg.text, group_id(bdg.group))
+                    ),
+                )
+                for hls, bdgs in rows
+            )
+            yield i1, i2, decors
+
+    packed = tuple(cont())
+    if packed:
+        args = (buf.number, ns, tuple(groups), packed)
+        atomic.call_function("luaeval", (_LUA_PROVIDER, args))
+
+
+def forget_provided(nvim: Nvim) -> None:
+    """
+    Drop the per row tables kept in lua, the provider then draws nothing
+    """
+
+    nvim.api.exec_lua(_FORGET_PROVIDED, ())
@@ -0,0 +1,34 @@
+(function ()
+  local api = vim.api
+  local tab = api.nvim_get_current_tabpage()
+  local wins, bufs = {}, {}
+
+  for _, win in ipairs(api.nvim_list_wins()) do
+    local row, col = unpack(vim.fn.win_screenpos(win))
+    table.insert(
+      wins,
+      {
+        win,
+        api.nvim_win_get_buf(win),
+        api.nvim_win_get_tabpage(win) == tab,
+        api.nvim_win_get_option(win, "previewwindow"),
+        row,
+        col
+      }
+    )
+  end
+
+  for _, buf in ipairs(api.nvim_list_bufs()) do
+    table.insert(
+      bufs,
+      {
+        buf,
+        api.nvim_buf_get_option(buf, "buflisted"),
+        api.nvim_buf_get_option(buf, "filetype"),
+        api.nvim_buf_get_name(buf)
+      }
+    )
+  end
+
+  return {wins, bufs}
+end)()
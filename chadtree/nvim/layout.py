@@ -0,0 +1,46 @@
+from pathlib import Path, PurePath
+
+from pynvim import Nvim
+from pynvim_pp.atomic import Atomic
+
+from .types import BufInfo, Layout, WinInfo
+
+_LUA = (Path(__file__).resolve().parent / "layout.lua").read_text("UTF-8")
+
+
+def layout(nvim: Nvim) -> Layout:
+    """
+    Windows, buffers & their metadata, in a single round trip
+
+    -> Handles come back as numbers, the batch also carries the actual objects
+    """
+
+    atomic = Atomic()
+    atomic.list_wins()
+    atomic.list_bufs()
+    atomic.call_function("luaeval", (_LUA,))
+    wins, bufs, (win_specs, buf_specs) = atomic.commit(nvim)
+
+    win_lookup = {win.handle: win for win in wins}
+    buf_lookup = {buf.number: buf for buf in bufs}
+
+    buf_infos = {
+        number: BufInfo(
+            buf=buf_lookup[number],
+            listed=listed,
+            filetype=filetype,
+            name=PurePath(name),
+        )
+        for number, listed, filetype, name in buf_specs
+    }
+    win_infos = tuple(
+        WinInfo(
+            win=win_lookup[handle],
+            buf=buf_infos[number],
+            in_tab=in_tab,
+            preview=preview,
+            pos=(row, col),
+        )
+        for handle, number, in_tab, preview, row, col in win_specs
+    )
+    return Layout(wins=win_infos, bufs=tuple(buf_infos.values()))
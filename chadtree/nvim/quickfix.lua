@@ -0,0 +1,48 @@
+(function (args)
+  local flat = unpack(args)
+  local known = {}
+  for i = 1, #flat, 2 do
+    known[flat[i]] = flat[i + 1]
+  end
+
+  local names = {}
+  local buf_name = function(buf)
+    local name = names[buf]
+    if not name then
+      name = vim.api.nvim_buf_get_name(buf)
+      names[buf] = name
+    end
+    return name
+  end
+
+  local lists, seen = {}, {}
+  local collect = function(get)
+    local info = get({id = 0, changedtick = 0})
+    local id, tick = info.id, info.changedtick
+    if id ~= 0 and not seen[id] then
+      seen[id] = true
+      if known[id] == tick then
+        table.insert(lists, {id, tick, vim.NIL})
+      else
+        local files = {}
+        for _, item in ipairs(get({id = id, items = 0}).items) do
+          if item.bufnr ~= 0 then
+            table.insert(files, buf_name(item.bufnr))
+          end
+        end
+        table.insert(lists, {id, tick, files})
+      end
+    end
+  end
+
+  collect(vim.fn.getqflist)
+  for _, win in ipairs(vim.api.nvim_tabpage_list_wins(0)) do
+    collect(
+      function(what)
+        return vim.fn.getloclist(win, what)
+      end
+    )
+  end
+
+  return lists
+end)(...)
@@ -1,27 +1,57 @@
-from collections import Counter
-from itertools import chain
-from typing import Iterator
+from pathlib import Path, PurePath
+from typing import Counter, Iterable, MutableMapping, Optional, Sequence, Tuple
 
 from pynvim import Nvim
-from pynvim_pp.api import get_cwd
 
-from ..fs.ops import ancestors
 from .types import QuickFix
 
-from pathlib import PurePath
+_LUA = (Path(__file__).resolve().parent / "quickfix.lua").read_text("UTF-8")
 
-def quickfix(nvim: Nvim) -> QuickFix:
-    cwd = PurePath(get_cwd(nvim))
-    ql = nvim.funcs.getqflist()
 
-    def it() -> Iterator[PurePath]:
-        for q in ql:
-            bufnr = q["bufnr"]
-            filename = nvim.funcs.bufname(bufnr)
-            yield cwd / filename
+def _tally(files: Iterable[str]) -> Counter[PurePath]:
+    """
+    Each entry counts towards its file & every ancestor
 
-    filenames = tuple(it())
-    parents = (ancestor for fullname in filenames for ancestor in ancestors(fullname))
-    locations = Counter(chain(filenames, parents))
-    qf = QuickFix(locations=locations)
-    return qf
+    -> Climbs one level at a time, entries sharing a directory merge on the way up
+    """
+
+    counts = Counter(PurePath(file) for file in files if file)
+    frontier = counts
+    while frontier:
+        parents: Counter[PurePath] = Counter()
+        for path, count in frontier.items():
+            parent = path.parent
+            if parent != path:
+                parents[parent] += count
+        counts.update(parents)
+        frontier = parents
+    return counts
+
+
+def quickfix(nvim: Nvim, prev: Optional[QuickFix]) -> QuickFix:
+    """
+    The quickfix list & every location list in the tab
+
+    -> Lists with the same `changedtick` as last time are not fetched again
+    """
+
+    lists = prev.lists if prev else {}
+    known = tuple(
+        val for list_id, (tick, _) in lists.items() for val in (list_id, tick)
+    )
+    specs: Sequence[Tuple[int, int, Optional[Sequence[str]]]] = nvim.funcs.luaeval(
+        _LUA, (known,)
+    )
+
+    if prev and len(specs) == len(lists) and all(files is None for *_, files in specs):
+        return prev
+    else:
+        new_lists: MutableMapping[int, Tuple[int, Counter[PurePath]]] = {}
+        for list_id, tick, files in specs:
+            _, tally = lists[list_id] if files is None else (tick, _tally(files))
+            new_lists[list_id] = tick, tally
+
+        locations: Counter[PurePath] = Counter()
+        for _, tally in new_lists.values():
+            locations.update(tally)
+        return QuickFix(locations=locations, lists=new_lists)
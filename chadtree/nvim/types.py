@@ -1,9 +1,54 @@
 from dataclasses import dataclass
 from pathlib import PurePath
-from typing import Mapping
+from typing import Counter, Mapping, Sequence, Tuple
+
+from pynvim.api import Buffer, Window
 
 
 @dataclass(frozen=True)
 class QuickFix:
-    locations: Mapping[PurePath, int]
+    locations: Counter[PurePath]
+    # list id -> (changedtick, tally)
+    lists: Mapping[int, Tuple[int, Counter[PurePath]]]
+
+
+@dataclass(frozen=True)
+class EditorCtx:
+    """
+    Rows are 0 indexed
+    """
+
+    win: int
+    buf: int
+    filetype: str
+    cursor: Tuple[int, int]
+    marks: Tuple[Tuple[int, int], Tuple[int, int]]
+    cwd: PurePath
+    buf_name: PurePath
+
+
+@dataclass(frozen=True)
+class BufInfo:
+    buf: Buffer
+    listed: bool
+    filetype: str
+    name: PurePath
+
+
+@dataclass(frozen=True)
+class WinInfo:
+    win: Window
+    buf: BufInfo
+    in_tab: bool
+    preview: bool
+    pos: Tuple[int, int]
+
+
+@dataclass(frozen=True)
+class Layout:
+    """
+    Every window & buffer, windows are in `nvim_list_wins` order
+    """
 
+    wins: Sequence[WinInfo]
+    bufs: Sequence[BufInfo]
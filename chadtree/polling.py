@@ -0,0 +1,95 @@
+from enum import Enum, auto
+from threading import Condition
+from time import monotonic
+from typing import Callable, Mapping, MutableMapping, Optional, Tuple
+
+from .settings.types import PollingInterval, PollingOpts
+
+
+class Poll(Enum):
+    fs = auto()
+    vc = auto()
+    session = auto()
+
+
+class Poller:
+    """
+    Each kind of poll backs off exponentially, from `min` to `max`, until poked
+    """
+
+    def __init__(self) -> None:
+        self._cond = Condition()
+        self._opts: Optional[PollingOpts] = None
+        self._paused = False
+        self._intervals: MutableMapping[Poll, float] = {}
+        self._due: MutableMapping[Poll, float] = {}
+
+    def _bounds(self, kind: Poll) -> PollingInterval:
+        assert self._opts
+        return getattr(self._opts, kind.name)
+
+    def _reset(self, now: float, immediately: bool) -> None:
+        for kind in Poll:
+            lo = self._bounds(kind).min
+            self._intervals[kind] = lo
+            due = now if immediately else now + lo
+            self._due[kind] = min(self._due.get(kind, due), due)
+        self._cond.notify_all()
+
+    def poke(self) -> None:
+        """
+        Something happened, poll eagerly again
+        """
+
+        with self._cond:
+            if self._opts:
+                self._reset(monotonic(), immediately=False)
+
+    def pause(self) -> None:
+        with self._cond:
+            self._paused = True
+
+    def resume(self) -> None:
+        """
+        Anything could have happened while paused, so poll right away
+        """
+
+        with self._cond:
+            self._paused = False
+            if self._opts:
+                self._reset(monotonic(), immediately=True)
+
+    def intervals(self) -> Tuple[bool, Mapping[Poll, float]]:
+        with self._cond:
+            return self._paused, {**self._intervals}
+
+    def _next(self) -> Poll:
+        with self._cond:
+            while True:
+                now = monotonic()
+                if self._paused:
+                    self._cond.wait()
+                else:
+                    kind, due = min(self._due.items(), key=lambda kv: kv[1])
+                    if due > now:
+                        self._cond.wait(due - now)
+                    else:
+                        interval = self._intervals[kind]
+                        self._due[kind] = now + interval
+                        self._intervals[kind] = min(
+                            interval * 2, self._bounds(kind).max
+                        )
+                        return kind
+
+    def configure(self, opts: PollingOpts) -> None:
+        with self._cond:
+            self._opts = opts
+            self._reset(monotonic(), immediately=False)
+
+    def run(self, opts: PollingOpts, fire: Callable[[Poll], None]) -> None:
+        self.configure(opts)
+        while True:
+            fire(self._next())
+
+
+poller = Poller()
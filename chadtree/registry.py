@@ -1,20 +1,142 @@
-from concurrent.futures import ThreadPoolExecutor
-from queue import SimpleQueue
-from typing import Any, Callable, TypeVar
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from queue import Empty
+from threading import Condition
+from time import perf_counter
+from typing import (
+    AbstractSet,
+    Any,
+    Callable,
+    Deque,
+    MutableMapping,
+    MutableSet,
+    Optional,
+    TypeVar,
+)
 
 from pynvim_pp.autocmd import AutoCMD
 from pynvim_pp.logging import log
 from pynvim_pp.rpc import RPC, RpcCallable, RpcMsg
 
+from .trace import enabled, span
+
 T = TypeVar("T")
+E = TypeVar("E", bound=RpcCallable)
+
+
+_defined: MutableMapping[str, MutableSet[str]] = {}
 
 
 def _name_gen(fn: Callable[[Callable[..., T]], str]) -> str:
+    _defined.setdefault(fn.__module__, set()).add(fn.__qualname__)
     return f"CHAD{fn.__qualname__.lstrip('_')}"
 
 
-pool = ThreadPoolExecutor()
-event_queue: SimpleQueue = SimpleQueue()
+def defined_in(module: str) -> AbstractSet[str]:
+    """
+    -> Handlers registered by `module`, by qualname
+    """
+
+    return {*_defined.get(module, ())}
+
+
+_background: MutableSet[str] = set()
+
+
+def background(event: E) -> E:
+    """
+    Served after interactive events, with at most one pending instance
+    """
+
+    _background.add(event.name)
+    return event
+
+
+def is_background(name: str) -> bool:
+    return name in _background
+
+
+_quiet: MutableSet[str] = set()
+
+
+def quiet(event: E) -> E:
+    """
+    Too frequent to mean the file system changed, polling is not sped up
+    """
+
+    _quiet.add(event.name)
+    return event
+
+
+def is_quiet(name: str) -> bool:
+    return name in _quiet
+
+
+class EventQueue:
+    def __init__(self) -> None:
+        self._cond = Condition()
+        self._interactive: Deque[RpcMsg] = deque()
+        self._background: MutableMapping[str, RpcMsg] = {}
+
+    def put(self, msg: RpcMsg) -> None:
+        name, _ = msg
+        with self._cond:
+            if name in _background:
+                # keeps its place in line, but with the latest args
+                self._background[name] = msg
+            else:
+                self._interactive.append(msg)
+            self._cond.notify()
+
+    def _pop(self) -> Optional[RpcMsg]:
+        if self._interactive:
+            return self._interactive.popleft()
+        elif self._background:
+            name = next(iter(self._background))
+            return self._background.pop(name)
+        else:
+            return None
+
+    def get(self) -> RpcMsg:
+        with self._cond:
+            while True:
+                msg = self._pop()
+                if msg:
+                    return msg
+                else:
+                    self._cond.wait()
+
+    def get_nowait(self) -> RpcMsg:
+        with self._cond:
+            msg = self._pop()
+            if msg:
+                return msg
+            else:
+                raise Empty()
+
+
+class _Pool(ThreadPoolExecutor):
+    def submit(self, fn: Callable[..., T], *args: Any, **kwargs: Any) -> Future:
+        """
+        Every task is a span when tracing, with how long it sat in the queue
+        """
+
+        if not enabled():
+            return super().submit(fn, *args, **kwargs)
+        else:
+            name = getattr(fn, "__qualname__", repr(fn))
+            t0 = perf_counter()
+
+            def cont() -> T:
+                queued = {"queued_us": (perf_counter() - t0) * 1e6}
+                with span(name, cat="pool", args=queued):
+                    return fn(*args, **kwargs)
+
+            return super().submit(cont)
+
+
+pool = _Pool()
+event_queue = EventQueue()
 autocmd = AutoCMD()
 rpc = RPC(name_gen=_name_gen)
 
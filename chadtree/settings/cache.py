@@ -0,0 +1,48 @@
+from hashlib import sha1
+from pathlib import Path
+from pickle import HIGHEST_PROTOCOL, dumps, loads
+from sys import version
+from tempfile import NamedTemporaryFile
+from typing import Callable, Sequence, TypeVar, cast
+
+from chad_types import TOP_LEVEL
+
+from ..consts import FOLDER_MODE
+
+T = TypeVar("T")
+
+# the schema of what gets pickled
+_SCHEMA = TOP_LEVEL / "chad_types.py"
+
+
+def _key(sources: Sequence[Path]) -> str:
+    hashed = sha1(version.encode())
+    for path in (_SCHEMA, *sources):
+        hashed.update(path.read_bytes())
+    return hashed.hexdigest()
+
+
+def cached(
+    name: str, cache_dir: Path, sources: Sequence[Path], load: Callable[[], T]
+) -> T:
+    """
+    Keyed by the content of `sources`, so a stale cache is never read
+
+    -> Any failure to read or write the cache just falls back to `load`
+    """
+
+    path = cache_dir / f"{name}-{_key(sources)}.pickle"
+    try:
+        return cast(T, loads(path.read_bytes()))
+    except Exception:
+        val = load()
+        try:
+            cache_dir.mkdir(mode=FOLDER_MODE, parents=True, exist_ok=True)
+            for stale in cache_dir.glob(f"{name}-*.pickle"):
+                stale.unlink()
+            with NamedTemporaryFile(dir=cache_dir, delete=False) as fd:
+                fd.write(dumps(val, protocol=HIGHEST_PROTOCOL))
+            Path(fd.name).replace(path)
+        except Exception:
+            pass
+        return val
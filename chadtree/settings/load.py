@@ -1,5 +1,6 @@
 from dataclasses import dataclass
 from enum import Enum, auto
+from json import loads
 from locale import strxfrm
 from typing import AbstractSet, Mapping, Optional, Sequence, SupportsFloat, Union, cast
 
@@ -20,10 +21,20 @@ from chad_types import (
     TextColourSetEnum,
 )
 
-from ..consts import CONFIG_YML, SETTINGS_VAR
+from ..consts import CACHE_DIR, CACHE_DIR_XDG, CONFIG_YML, SETTINGS_VAR
 from ..view.load import load_theme
-from ..view.types import HLGroups, Sortby
-from .types import Ignored, MimetypeOptions, Settings, VersionCtlOpts, ViewOptions
+from ..view.suffixes import SuffixTrie
+from ..view.types import Collation, HLGroups, Sortby
+from .cache import cached
+from .types import (
+    Ignored,
+    MimetypeOptions,
+    PollingInterval,
+    PollingOpts,
+    Settings,
+    VersionCtlOpts,
+    ViewOptions,
+)
 
 
 class _OpenDirection(Enum):
@@ -31,14 +42,29 @@ class _OpenDirection(Enum):
     right = auto()
 
 
+@dataclass(frozen=True)
+class _UserPollingInterval:
+    min: SupportsFloat
+    max: SupportsFloat
+
+
+@dataclass(frozen=True)
+class _UserPolling:
+    fs: _UserPollingInterval
+    vc: _UserPollingInterval
+    session: _UserPollingInterval
+
+
 @dataclass(frozen=True)
 class _UserOptions:
     close_on_open: bool
     follow: bool
     lang: Optional[str]
+    max_fps: SupportsFloat
     mimetypes: MimetypeOptions
     page_increment: int
-    polling_rate: SupportsFloat
+    polling: _UserPolling
+    polling_rate: Optional[SupportsFloat]
     session: bool
     show_hidden: bool
     version_control: VersionCtlOpts
@@ -58,6 +84,8 @@ class _UserView:
     open_direction: _OpenDirection
     width: int
     sort_by: Sequence[Sortby]
+    collation: Collation
+    lazy_decorations: bool
     time_format: str
     window_options: Mapping[str, Union[bool, str]]
 
@@ -71,6 +99,18 @@ class _UserConfig:
     theme: _UserTheme
     xdg: bool
     profiling: bool
+    trace: bool
+
+
+def _interval(
+    interval: _UserPollingInterval, rate: Optional[SupportsFloat]
+) -> PollingInterval:
+    """
+    -> Deprecated `polling_rate`, if set, is every `min`
+    """
+
+    lo = float(interval.min if rate is None else rate)
+    return PollingInterval(min=lo, max=max(lo, float(interval.max)))
 
 
 def _key_sort(keys: AbstractSet[str]) -> Sequence[str]:
@@ -79,14 +119,24 @@ def _key_sort(keys: AbstractSet[str]) -> Sequence[str]:
 
 def initial(nvim: Nvim, specs: Sequence[RpcSpec]) -> Settings:
     win = cur_win(nvim)
-    artifacts: Artifact = decode(Artifact, safe_load(ARTIFACT.read_text("UTF-8")))
-
-    user_config = nvim.vars.get(SETTINGS_VAR, {})
+    user_config = hydrate(nvim.vars.get(SETTINGS_VAR, {}))
+    use_xdg = isinstance(user_config, Mapping) and user_config.get("xdg") is True
+    cache_dir = CACHE_DIR_XDG if use_xdg else CACHE_DIR
+
+    artifacts = cached(
+        "artifact",
+        cache_dir=cache_dir,
+        sources=(ARTIFACT,),
+        load=lambda: decode(Artifact, loads(ARTIFACT.read_text("UTF-8"))),
+    )
+    defaults = cached(
+        "defaults",
+        cache_dir=cache_dir,
+        sources=(CONFIG_YML,),
+        load=lambda: safe_load(CONFIG_YML.read_text("UTF-8")),
+    )
     config: _UserConfig = decode(
-        _UserConfig,
-        merge(
-            safe_load(CONFIG_YML.read_text("UTF-8")), hydrate(user_config), replace=True
-        ),
+        _UserConfig, merge(defaults, user_config, replace=True)
     )
     options, view, theme = config.options, config.view, config.theme
     win_actual_opts: Mapping[str, Union[bool, str]] = {
@@ -105,8 +155,11 @@ def initial(nvim: Nvim, specs: Sequence[RpcSpec]) -> Settings:
     )
 
     view_opts = ViewOptions(
+        collation=view.collation,
         hl_context=hl_context,
         icons=icons,
+        icon_glyph_exts=SuffixTrie(icons.ext_exact),
+        lazy_decorations=view.lazy_decorations,
         sort_by=view.sort_by,
         use_icons=theme.icon_glyph_set is not IconGlyphSetEnum.ascii,
         time_fmt=view.time_format,
@@ -130,10 +183,15 @@ def initial(nvim: Nvim, specs: Sequence[RpcSpec]) -> Settings:
         ignores=config.ignore,
         keymap=keymap,
         lang=options.lang,
+        max_fps=float(options.max_fps),
         mime=options.mimetypes,
         open_left=view.open_direction is _OpenDirection.left,
         page_increment=options.page_increment,
-        polling_rate=float(options.polling_rate),
+        polling=PollingOpts(
+            fs=_interval(options.polling.fs, rate=options.polling_rate),
+            vc=_interval(options.polling.vc, rate=options.polling_rate),
+            session=_interval(options.polling.session, rate=options.polling_rate),
+        ),
         session=options.session,
         show_hidden=options.show_hidden,
         version_ctl=options.version_control,
@@ -143,6 +201,7 @@ def initial(nvim: Nvim, specs: Sequence[RpcSpec]) -> Settings:
         win_local_opts=view.window_options,
         xdg=config.xdg,
         profiling=config.profiling,
+        trace=config.trace,
     )
 
     return settings
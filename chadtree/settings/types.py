@@ -10,6 +10,19 @@ class VersionCtlOpts:
     enable: bool
 
 
+@dataclass(frozen=True)
+class PollingInterval:
+    min: float
+    max: float
+
+
+@dataclass(frozen=True)
+class PollingOpts:
+    fs: PollingInterval
+    vc: PollingInterval
+    session: PollingInterval
+
+
 @dataclass(frozen=True)
 class MimetypeOptions:
     warn: AbstractSet[str]
@@ -23,13 +36,15 @@ class Settings:
     ignores: Ignored
     keymap: Mapping[str, AbstractSet[str]]
     lang: Optional[str]
+    max_fps: float
     mime: MimetypeOptions
     open_left: bool
     page_increment: int
-    polling_rate: float
+    polling: PollingOpts
     profiling: bool
     session: bool
     show_hidden: bool
+    trace: bool
     version_ctl: VersionCtlOpts
     view: ViewOptions
     width: int
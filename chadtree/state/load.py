@@ -1,3 +1,4 @@
+from functools import partial
 from pathlib import PurePath
 
 from pynvim import Nvim
@@ -8,7 +9,7 @@ from ..nvim.quickfix import quickfix
 from ..settings.types import Settings
 from ..view.render import render
 from .ops import load_session
-from .types import Selection, State, VCStatus
+from .types import Lazy, Selection, State, VCStatus
 
 
 def initial(nvim: Nvim, settings: Settings) -> State:
@@ -29,23 +30,25 @@ def initial(nvim: Nvim, settings: Settings) -> State:
     )
 
     selection: Selection = set()
-    node = new(cwd, index=index)
-    qf = quickfix(nvim)
+    walk = Lazy(partial(new, cwd, index=index))
+    qf = quickfix(nvim, prev=None)
     vc = VCStatus()
 
     current = None
     filter_pattern = None
 
-    derived = render(
-        node,
-        settings=settings,
-        index=index,
-        selection=selection,
-        filter_pattern=filter_pattern,
-        qf=qf,
-        vc=vc,
-        show_hidden=show_hidden,
-        current=current,
+    derive = Lazy(
+        lambda: render(
+            walk(),
+            settings=settings,
+            index=index,
+            selection=selection,
+            filter_pattern=filter_pattern,
+            qf=qf,
+            vc=vc,
+            show_hidden=show_hidden,
+            current=current,
+        )
     )
 
     state = State(
@@ -55,12 +58,14 @@ def initial(nvim: Nvim, settings: Settings) -> State:
         show_hidden=show_hidden,
         follow=settings.follow,
         enable_vc=enable_vc,
+        generation=0,
         width=settings.width,
-        root=node,
+        walk=walk,
+        root_path=cwd,
         qf=qf,
         vc=vc,
         current=current,
-        derived=derived,
+        derive=derive,
     )
     return state
 
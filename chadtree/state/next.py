@@ -1,13 +1,21 @@
 from pathlib import PurePath
-from typing import AbstractSet, Optional, Union, cast
+from typing import AbstractSet, Optional, Union
 
 from std2.types import Void, VoidType, or_else
 
-from ..fs.cartographer import update
+from ..fs.cartographer import new, update
 from ..fs.types import Node
 from ..settings.types import Settings
 from ..view.render import render
-from .types import FilterPattern, Index, QuickFix, Selection, State, VCStatus
+from .types import (
+    FilterPattern,
+    Index,
+    Lazy,
+    QuickFix,
+    Selection,
+    State,
+    VCStatus,
+)
 
 
 def forward(
@@ -15,6 +23,7 @@ def forward(
     *,
     settings: Settings,
     root: Union[Node, VoidType] = Void,
+    cwd: Union[PurePath, VoidType] = Void,
     index: Union[Index, VoidType] = Void,
     selection: Union[Selection, VoidType] = Void,
     filter_pattern: Union[Optional[FilterPattern], VoidType] = Void,
@@ -31,28 +40,45 @@ def forward(
     new_selection = or_else(selection, state.selection)
     new_filter_pattern = or_else(filter_pattern, state.filter_pattern)
     new_current = or_else(current, state.current)
-    new_root = cast(
-        Node,
-        root
-        or (
-            update(state.root, index=new_index, paths=paths)
-            if not isinstance(paths, VoidType)
-            else state.root
-        ),
-    )
+    if not isinstance(root, VoidType):
+        new_root = root
+        root_path = new_root.path
+        walk = Lazy(lambda: new_root)
+    elif not isinstance(cwd, VoidType):
+        # the path is known up front, only the walk is deferred
+        root_path = cwd
+        walk = Lazy(lambda: new(root_path, index=new_index))
+    elif not isinstance(paths, VoidType):
+        new_paths = paths
+        root_path = state.root_path
+        walk = Lazy(lambda: update(state.root, index=new_index, paths=new_paths))
+    else:
+        root_path = state.root_path
+        walk = state.walk
     new_qf = or_else(qf, state.qf)
     new_vc = or_else(vc, state.vc)
     new_hidden = or_else(show_hidden, state.show_hidden)
-    derived = render(
-        new_root,
-        settings=settings,
-        index=new_index,
-        selection=new_selection,
-        filter_pattern=new_filter_pattern,
-        qf=new_qf,
-        vc=new_vc,
-        show_hidden=new_hidden,
-        current=new_current,
+    new_enable_vc = or_else(enable_vc, state.enable_vc)
+    # background work started before a new root / vc toggle is no longer relevant
+    generation = (
+        state.generation + 1
+        if not isinstance(root, VoidType)
+        or not isinstance(cwd, VoidType)
+        or new_enable_vc != state.enable_vc
+        else state.generation
+    )
+    derive = Lazy(
+        lambda: render(
+            walk(),
+            settings=settings,
+            index=new_index,
+            selection=new_selection,
+            filter_pattern=new_filter_pattern,
+            qf=new_qf,
+            vc=new_vc,
+            show_hidden=new_hidden,
+            current=new_current,
+        )
     )
 
     new_state = State(
@@ -61,13 +87,15 @@ def forward(
         filter_pattern=new_filter_pattern,
         show_hidden=new_hidden,
         follow=or_else(follow, state.follow),
-        enable_vc=or_else(enable_vc, state.enable_vc),
+        enable_vc=new_enable_vc,
+        generation=generation,
         width=or_else(width, state.width),
-        root=new_root,
+        walk=walk,
+        root_path=root_path,
         qf=new_qf,
         vc=new_vc,
         current=new_current,
-        derived=derived,
+        derive=derive,
     )
 
     return new_state
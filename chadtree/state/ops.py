@@ -1,14 +1,23 @@
+from contextlib import suppress
 from hashlib import sha1
 from json import dumps, loads
+from os import O_CREAT, O_EXCL, O_WRONLY, chmod
+from os import open as os_open
+from os import replace, stat, unlink
 from pathlib import Path, PurePath
-from typing import Any, Optional
+from stat import S_IMODE
+from typing import Any, MutableMapping, Optional
+from uuid import uuid4
 
 from std2.pickle import decode, encode
 from std2.pickle.coders import BUILTIN_DECODERS, BUILTIN_ENCODERS
 
 from ..consts import FOLDER_MODE, SESSION_DIR, SESSION_DIR_XDG
+from ..fs.ops import ancestors
 from .types import Session, State
 
+_SAVED: MutableMapping[Path, Session] = {}
+
 
 def _session_path(cwd: PurePath, use_xdg: bool) -> Path:
     hashed = sha1(str(cwd).encode()).hexdigest()
@@ -24,25 +33,80 @@ def _load_json(path: Path) -> Optional[Any]:
         return None
 
 
+def _relative(root: PurePath, path: PurePath) -> PurePath:
+    """
+    Sessions are per root, so only paths outside of it need to be spelt out
+    """
+
+    return path.relative_to(root) if root in ancestors(path) else path
+
+
 def load_session(cwd: PurePath, use_xdg: bool) -> Session:
     load_path = _session_path(cwd, use_xdg=use_xdg)
     try:
-        session: Session = decode(
+        stored: Session = decode(
             Session, _load_json(load_path), decoders=BUILTIN_DECODERS
         )
+        # absolute paths, as older sessions have them, are left alone by `/`
+        index = None if stored.index is None else {cwd / p for p in stored.index}
+        session = Session(
+            index=index, show_hidden=stored.show_hidden, enable_vc=stored.enable_vc
+        )
+        _SAVED[load_path] = session
         return session
     except Exception:
         return Session(index=None, show_hidden=None, enable_vc=None)
 
 
+def _dirty(path: Path, session: Session) -> bool:
+    saved = _SAVED.get(path)
+    return not saved or (
+        saved.show_hidden != session.show_hidden
+        or saved.enable_vc != session.enable_vc
+        or (saved.index is not session.index and saved.index != session.index)
+    )
+
+
 def dump_session(state: State, use_xdg: bool) -> None:
+    """
+    Only written if changed, & atomically, so a kill mid write can't tear the file
+    """
+
     session = Session(
         index=state.index, show_hidden=state.show_hidden, enable_vc=state.enable_vc
     )
-    json = encode(session, encoders=BUILTIN_ENCODERS)
+    root = state.root_path
+    path = _session_path(root, use_xdg=use_xdg)
+    if _dirty(path, session=session):
+        stored = Session(
+            index={_relative(root, path=p) for p in state.index},
+            show_hidden=session.show_hidden,
+            enable_vc=session.enable_vc,
+        )
+        json = dumps(
+            encode(stored, encoders=BUILTIN_ENCODERS),
+            ensure_ascii=False,
+            check_circular=False,
+            separators=(",", ":"),
+        )
+        path.parent.mkdir(mode=FOLDER_MODE, parents=True, exist_ok=True)
 
-    path = _session_path(state.root.path, use_xdg=use_xdg)
-    path.parent.mkdir(mode=FOLDER_MODE, parents=True, exist_ok=True)
-    json = dumps(json, ensure_ascii=False, check_circular=False, indent=2)
-    path.write_text(json, "UTF-8")
+        try:
+            mode: Optional[int] = S_IMODE(stat(path).st_mode)
+        except FileNotFoundError:
+            mode = None
 
+        tmp = path.with_suffix(f".{uuid4().hex}.tmp")
+        try:
+            # same permissions as a plain `open(..., "w")`, umask & all
+            fd = os_open(tmp, O_WRONLY | O_CREAT | O_EXCL, 0o666)
+            with open(fd, "w", encoding="UTF-8") as f:
+                f.write(json)
+            if mode is not None:
+                chmod(tmp, mode)
+            replace(tmp, path)
+        except BaseException:
+            with suppress(FileNotFoundError):
+                unlink(tmp)
+            raise
+        _SAVED[path] = session
@@ -1,16 +1,38 @@
 from dataclasses import dataclass
 from pathlib import PurePath
-from typing import AbstractSet, Optional
+from threading import Lock
+from typing import AbstractSet, Callable, Generic, Optional, TypeVar, cast
 
 from ..fs.types import Node
 from ..nvim.types import QuickFix
 from ..version_ctl.types import VCStatus
 from ..view.types import Derived
 
+T = TypeVar("T")
+
 Index = AbstractSet[PurePath]
 Selection = Index
 
 
+class Lazy(Generic[T]):
+    """
+    Computed at most once, on whichever thread asks first
+    """
+
+    def __init__(self, thunk: Callable[[], T]) -> None:
+        self._lock = Lock()
+        self._thunk: Optional[Callable[[], T]] = thunk
+        self._val: Optional[T] = None
+
+    def __call__(self) -> T:
+        with self._lock:
+            if self._thunk:
+                self._val = self._thunk()
+                # drop the closure, so superseded states can be collected
+                self._thunk = None
+            return cast(T, self._val)
+
+
 @dataclass(frozen=True)
 class FilterPattern:
     pattern: str
@@ -19,18 +41,36 @@ class FilterPattern:
 @dataclass(frozen=True)
 class State:
     current: Optional[PurePath]
-    derived: Derived
+    derive: Lazy[Derived]
     enable_vc: bool
     filter_pattern: Optional[FilterPattern]
     follow: bool
+    generation: int
     index: Index
     qf: QuickFix
-    root: Node
+    root_path: PurePath
     selection: Selection
     show_hidden: bool
     vc: VCStatus
+    walk: Lazy[Node]
     width: int
 
+    @property
+    def root(self) -> Node:
+        """
+        Walked on first use, off the `nvim` thread if nobody asks for it sooner
+        """
+
+        return self.walk()
+
+    @property
+    def derived(self) -> Derived:
+        """
+        Rendered on first use, transitions that are superseded never pay for it
+        """
+
+        return self.derive()
+
 
 @dataclass(frozen=True)
 class Session:
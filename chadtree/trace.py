@@ -0,0 +1,93 @@
+from contextlib import contextmanager
+from json import dumps
+from os import getpid
+from pathlib import Path
+from threading import Lock, get_ident
+from time import perf_counter, time
+from typing import Any, Iterator, Mapping, Optional, TextIO
+
+from .consts import FOLDER_MODE, TRACE_DIR, TRACE_DIR_XDG, TRACE_MAX_BYTES
+
+_lock = Lock()
+_pid = getpid()
+_sink: Optional[TextIO] = None
+_written = 0
+
+
+def trace_path(use_xdg: bool) -> Path:
+    name = f"{int(time())}-{_pid}.json"
+    return (TRACE_DIR_XDG if use_xdg else TRACE_DIR) / name
+
+
+def enable(path: Path) -> None:
+    """
+    Chrome Trace Event format, the closing `]` is optional
+
+    -> One event per line, so the file is readable even if we get killed
+
+    -> Past `TRACE_MAX_BYTES`, it starts over, only the latest events are kept
+    """
+
+    global _sink, _written
+
+    path.parent.mkdir(mode=FOLDER_MODE, parents=True, exist_ok=True)
+    sink = path.open("w", encoding="UTF-8", buffering=1)
+    sink.write("[\n")
+    with _lock:
+        _sink, _written = sink, 0
+
+
+def enabled() -> bool:
+    return _sink is not None
+
+
+def emit(
+    name: str,
+    cat: str,
+    start: float,
+    elapsed: float,
+    args: Optional[Mapping[str, Any]] = None,
+) -> None:
+    sink = _sink
+    if sink:
+        event = {
+            "name": name,
+            "cat": cat,
+            "ph": "X",
+            "ts": start * 1e6,
+            "dur": elapsed * 1e6,
+            "pid": _pid,
+            "tid": get_ident(),
+            "args": args or {},
+        }
+        line = dumps(event, ensure_ascii=False, check_circular=False) + ",\n"
+        _write(sink, line=line)
+
+
+def _write(sink: TextIO, line: str) -> None:
+    global _written
+
+    # the cap is on the file, so bytes, not characters
+    size = len(line.encode("UTF-8"))
+    with _lock:
+        if _written + size > TRACE_MAX_BYTES:
+            sink.seek(0)
+            sink.truncate()
+            sink.write("[\n")
+            _written = 0
+        sink.write(line)
+        _written += size
+
+
+@contextmanager
+def span(
+    name: str, cat: str, args: Optional[Mapping[str, Any]] = None
+) -> Iterator[None]:
+    if not _sink:
+        yield None
+    else:
+        t1 = perf_counter()
+        try:
+            yield None
+        finally:
+            emit(name, cat=cat, start=t1, elapsed=perf_counter() - t1, args=args)
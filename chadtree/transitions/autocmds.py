@@ -9,28 +9,104 @@ from pynvim_pp.api import get_cwd, win_close
 from pynvim_pp.float_win import list_floatwins
 
 from ..nvim.quickfix import quickfix
-from ..registry import autocmd, rpc
+from ..polling import poller
+from ..registry import autocmd, background, enqueue_event, quiet, rpc
 from ..settings.types import Settings
 from ..state.next import forward
 from ..state.ops import dump_session
 from ..state.types import State
 from .shared.current import new_current_file, new_root
-from .shared.wm import find_current_buffer_name
+from .shared.dormant import asleep, owe_cwd
+from .shared.wm import find_current_buffer_name, forget_layout
 from .types import Stage
 
 
+@background
 @rpc(blocking=False)
 def save_session(nvim: Nvim, state: State, settings: Settings) -> None:
     """
     Save CHADTree state
     """
 
+    # deferred to the next poll once awake, `ExitPre` saves regardless
+    if not asleep():
+        dump_session(state, use_xdg=settings.xdg)
+
+
+@rpc(blocking=False)
+def _exit_save(nvim: Nvim, state: State, settings: Settings) -> None:
+    """
+    Save CHADTree state, dormant or not
+    """
+
     dump_session(state, use_xdg=settings.xdg)
 
 
-autocmd("FocusLost", "ExitPre") << f"lua {save_session.name}()"
+autocmd("ExitPre") << f"lua {_exit_save.name}()"
+
+
+@rpc(blocking=False)
+def _focus_lost(nvim: Nvim, state: State, settings: Settings) -> None:
+    """
+    Save session & stop polling while away
+    """
+
+    poller.pause()
+    enqueue_event(save_session)
+
+
+autocmd("FocusLost") << f"lua {_focus_lost.name}()"
+
+
+@rpc(blocking=False)
+def _focus_gained(nvim: Nvim, state: State, settings: Settings) -> None:
+    """
+    Catch up & resume polling
+    """
+
+    poller.resume()
+
+
+autocmd("FocusGained") << f"lua {_focus_gained.name}()"
 
 
+@rpc(blocking=False)
+def _buf_written(nvim: Nvim, state: State, settings: Settings) -> None:
+    """
+    Writes are likely to change the tree & vc status
+    """
+
+    poller.poke()
+
+
+autocmd("BufWritePost") << f"lua {_buf_written.name}()"
+
+
+@background
+@rpc(blocking=False)
+def _layout_changed(nvim: Nvim, state: State, settings: Settings) -> None:
+    """
+    Windows or buffers came & went, behind our back
+    """
+
+    forget_layout()
+
+
+(
+    autocmd(
+        "WinNew",
+        "WinClosed",
+        "BufAdd",
+        "BufDelete",
+        "BufWipeout",
+        "BufWinEnter",
+        "FileType",
+    )
+    << f"lua {_layout_changed.name}()"
+)
+
+
+@quiet
 @rpc(blocking=False)
 def _kill_float_wins(nvim: Nvim, state: State, settings: Settings) -> None:
     try:
@@ -46,28 +122,36 @@ autocmd("WinEnter") << f"lua {_kill_float_wins.name}()"
 
 
 @rpc(blocking=False)
-def _changedir(nvim: Nvim, state: State, settings: Settings) -> Stage:
+def _changedir(nvim: Nvim, state: State, settings: Settings) -> Optional[Stage]:
     """
     Follow cwd update
     """
 
     cwd = PurePath(get_cwd(nvim))
     chdir(cwd)
-    new_state = new_root(
-        nvim, state=state, settings=settings, new_cwd=cwd, indices=set()
-    )
-    return Stage(new_state)
+    if asleep():
+        owe_cwd(cwd)
+        return None
+    else:
+        new_state = new_root(
+            nvim, state=state, settings=settings, new_cwd=cwd, indices=set()
+        )
+        return Stage(new_state)
 
 
 autocmd("DirChanged") << f"lua {_changedir.name}()"
 
 
+@quiet
 @rpc(blocking=False)
 def _update_follow(nvim: Nvim, state: State, settings: Settings) -> Optional[Stage]:
     """
     Follow buffer
     """
 
+    if asleep():
+        return None
+
     try:
         curr = find_current_buffer_name(nvim)
         if isfile(curr):
@@ -82,15 +166,19 @@ def _update_follow(nvim: Nvim, state: State, settings: Settings) -> Optional[Sta
 autocmd("BufEnter") << f"lua {_update_follow.name}()"
 
 
+@background
 @rpc(blocking=False)
-def _update_quickfix(nvim: Nvim, state: State, settings: Settings) -> Stage:
+def _update_quickfix(nvim: Nvim, state: State, settings: Settings) -> Optional[Stage]:
     """
     Update quickfix list
     """
 
-    qf = quickfix(nvim)
-    new_state = forward(state, settings=settings, qf=qf)
-    return Stage(new_state)
+    qf = quickfix(nvim, prev=state.qf)
+    if qf is state.qf:
+        return None
+    else:
+        new_state = forward(state, settings=settings, qf=qf)
+        return Stage(new_state)
 
 
 autocmd("QuickfixCmdPost") << f"lua {_update_quickfix.name}()"
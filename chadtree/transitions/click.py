@@ -30,7 +30,7 @@ def _click(
             return None
         else:
             if is_dir(node):
-                if node.path == state.root.path:
+                if node.path == state.root_path:
                     return None
                 elif state.filter_pattern:
                     write(nvim, LANG("filter_click"))
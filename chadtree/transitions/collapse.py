@@ -35,7 +35,7 @@ def _collapse(
             if path in (ancestors(indexed) | {indexed})
         }
 
-        index = (state.index - paths) | {state.root.path}
+        index = (state.index - paths) | {state.root_path}
         new_state = forward(state, settings=settings, index=index, paths=paths)
         return Stage(new_state, focus=path)
 
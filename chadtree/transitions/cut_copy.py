@@ -5,21 +5,24 @@ from pathlib import PurePath
 from typing import AbstractSet, Callable, Mapping, MutableMapping, Optional
 
 from pynvim.api import Nvim
-from pynvim_pp.api import ask, ask_mc, get_cwd
+from pynvim_pp.api import ask, ask_mc
 from pynvim_pp.lib import write
 
 from ..fs.cartographer import is_dir
+from ..fs.jobs import Progress
 from ..fs.ops import ancestors, copy, cut, exists, unify_ancestors
 from ..fs.types import Node
 from ..lsp.notify import lsp_created, lsp_moved
+from ..nvim.context import editor_ctx
+from ..nvim.types import EditorCtx
 from ..registry import rpc
 from ..settings.localization import LANG
 from ..settings.types import Settings
 from ..state.next import forward
 from ..state.types import State
 from ..view.ops import display_path
-from .shared.index import indices
-from .shared.refresh import refresh
+from .jobs import start_job
+from .shared.index import ctx_indices
 from .shared.wm import kill_buffers
 from .types import Stage
 
@@ -33,15 +36,16 @@ def _find_dest(src: PurePath, node: Node) -> PurePath:
 def _operation(
     nvim: Nvim,
     *,
+    ctx: EditorCtx,
     state: State,
     settings: Settings,
     is_visual: bool,
     nono: AbstractSet[PurePath],
     op_name: str,
     is_move: bool,
-    action: Callable[[Mapping[PurePath, PurePath]], None],
+    action: Callable[[Mapping[PurePath, PurePath], Progress], None],
 ) -> Optional[Stage]:
-    node = next(indices(nvim, state=state, is_visual=is_visual), None)
+    node = next(ctx_indices(ctx, state=state, is_visual=is_visual), None)
     selection = state.selection
     unified = unify_ancestors(selection)
 
@@ -103,15 +107,11 @@ def _operation(
             if not ans:
                 return None
             else:
-                try:
-                    action(operations)
-                except Exception as e:
-                    write(nvim, e, error=True)
-                    return refresh(nvim, state=state, settings=settings)
-                else:
-                    paths = {
-                        p.parent for p in chain(operations.keys(), operations.values())
-                    }
+                paths = {
+                    p.parent for p in chain(operations.keys(), operations.values())
+                }
+
+                def finish(nvim: Nvim, state: State, settings: Settings) -> Stage:
                     index = state.index | paths
                     new_selection = {*operations.values()}
                     new_state = forward(
@@ -138,6 +138,21 @@ def _operation(
                         lsp_created(nvim, paths=new_selection)
                     return Stage(new_state, focus=focus)
 
+                started = start_job(
+                    nvim,
+                    name=op_name,
+                    touches={*operations.keys(), *operations.values()},
+                    paths=paths,
+                    run=lambda progress: action(operations, progress),
+                    finish=finish,
+                )
+                if not started:
+                    return None
+                else:
+                    # so that the same selection can't be sent off twice
+                    new_state = forward(state, settings=settings, selection=set())
+                    return Stage(new_state)
+
 
 @rpc(blocking=False)
 def _cut(
@@ -147,10 +162,12 @@ def _cut(
     Cut selected
     """
 
-    cwd, root = PurePath(get_cwd(nvim)), state.root.path
+    ctx = editor_ctx(nvim)
+    cwd, root = ctx.cwd, state.root_path
     nono = {cwd, root} | ancestors(cwd) | ancestors(root)
     return _operation(
         nvim,
+        ctx=ctx,
         state=state,
         settings=settings,
         is_visual=is_visual,
@@ -171,6 +188,7 @@ def _copy(
 
     return _operation(
         nvim,
+        ctx=editor_ctx(nvim),
         state=state,
         settings=settings,
         is_visual=is_visual,
@@ -3,40 +3,67 @@ from os import linesep
 from pathlib import PurePath
 from shutil import which
 from subprocess import DEVNULL, PIPE, CalledProcessError, check_call
-from typing import Callable, Iterable, Optional
+from typing import AbstractSet, Callable, Optional
 
 from pynvim.api import Nvim
-from pynvim_pp.api import ask_mc, get_cwd
+from pynvim_pp.api import ask_mc
 from pynvim_pp.lib import threadsafe_call, write
 from pynvim_pp.logging import log
 
 from ..fs.ops import ancestors, remove, unify_ancestors
 from ..lsp.notify import lsp_removed
+from ..nvim.context import editor_ctx
 from ..registry import enqueue_event, pool, rpc
 from ..settings.localization import LANG
 from ..settings.types import Settings
 from ..state.next import forward
 from ..state.types import State
 from ..view.ops import display_path
+from .jobs import start_job
 from .refresh import refresh as _refresh
-from .shared.index import indices
-from .shared.refresh import refresh
+from .shared.index import ctx_indices
 from .shared.wm import kill_buffers
 from .types import Stage
 
 
+def _removed(
+    nvim: Nvim,
+    state: State,
+    settings: Settings,
+    unified: AbstractSet[PurePath],
+    selection: AbstractSet[PurePath],
+) -> Stage:
+    paths = {path.parent for path in unified}
+    new_state = forward(state, settings=settings, selection=set(), paths=paths)
+
+    kill_buffers(nvim, paths=selection, reopen={})
+    lsp_removed(nvim, paths=unified)
+    return Stage(new_state)
+
+
 def _remove(
     nvim: Nvim,
     state: State,
     settings: Settings,
     is_visual: bool,
-    yeet: Callable[[Iterable[PurePath]], None],
+    yeet: Callable[
+        [
+            Nvim,
+            State,
+            Settings,
+            PurePath,
+            AbstractSet[PurePath],
+            AbstractSet[PurePath],
+        ],
+        Optional[Stage],
+    ],
 ) -> Optional[Stage]:
-    cwd, root = PurePath(get_cwd(nvim)), state.root.path
+    ctx = editor_ctx(nvim)
+    cwd, root = ctx.cwd, state.root_path
     nono = {cwd, root} | ancestors(cwd) | ancestors(root)
 
     selection = state.selection or {
-        node.path for node in indices(nvim, state=state, is_visual=is_visual)
+        node.path for node in ctx_indices(ctx, state=state, is_visual=is_visual)
     }
     unified = unify_ancestors(selection)
 
@@ -61,20 +88,32 @@ def _remove(
         if not ans:
             return None
         else:
-            try:
-                yeet(unified)
-            except Exception as e:
-                write(nvim, e, error=True)
-                return refresh(nvim, state=state, settings=settings)
-            else:
-                paths = {path.parent for path in unified}
-                new_state = forward(
-                    state, settings=settings, selection=set(), paths=paths
-                )
-
-                kill_buffers(nvim, paths=selection, reopen={})
-                lsp_removed(nvim, paths=unified)
-                return Stage(new_state)
+            return yeet(nvim, state, settings, cwd, unified, selection)
+
+
+def _rm(
+    nvim: Nvim,
+    state: State,
+    settings: Settings,
+    cwd: PurePath,
+    unified: AbstractSet[PurePath],
+    selection: AbstractSet[PurePath],
+) -> Optional[Stage]:
+    started = start_job(
+        nvim,
+        name=LANG("delete"),
+        touches=unified,
+        paths={path.parent for path in unified},
+        run=lambda progress: remove(unified, progress=progress),
+        finish=lambda nvim, state, settings: _removed(
+            nvim, state=state, settings=settings, unified=unified, selection=selection
+        ),
+    )
+    if not started:
+        return None
+    else:
+        new_state = forward(state, settings=settings, selection=set())
+        return Stage(new_state)
 
 
 @rpc(blocking=False)
@@ -85,36 +124,39 @@ def _delete(
     Delete selected
     """
 
-    return _remove(
-        nvim, state=state, settings=settings, is_visual=is_visual, yeet=remove
-    )
-
-
-def _sys_trash(nvim: Nvim) -> Callable[[Iterable[PurePath]], None]:
-    cwd = PurePath(get_cwd(nvim))
-
-    def cont(paths: Iterable[PurePath]) -> None:
-        def c1() -> None:
-            cmd = "trash"
-            if which(cmd):
-                command = (cmd, "--", *map(str, paths))
-                check_call(command, stdin=DEVNULL, stdout=PIPE, stderr=PIPE, cwd=cwd)
-            else:
-                raise LookupError(LANG("sys_trash_err"))
+    return _remove(nvim, state=state, settings=settings, is_visual=is_visual, yeet=_rm)
 
-        def c2() -> None:
-            try:
-                c1()
-            except (CalledProcessError, LookupError) as e:
-                threadsafe_call(nvim, write, nvim, e, error=True)
-            except Exception as e:
-                log.exception("%s", e)
-            else:
-                enqueue_event(_refresh, True)
 
-        pool.submit(c2)
+def _sys_trash(
+    nvim: Nvim,
+    state: State,
+    settings: Settings,
+    cwd: PurePath,
+    unified: AbstractSet[PurePath],
+    selection: AbstractSet[PurePath],
+) -> Stage:
+    def c1() -> None:
+        cmd = "trash"
+        if which(cmd):
+            command = (cmd, "--", *map(str, unified))
+            check_call(command, stdin=DEVNULL, stdout=PIPE, stderr=PIPE, cwd=cwd)
+        else:
+            raise LookupError(LANG("sys_trash_err"))
+
+    def c2() -> None:
+        try:
+            c1()
+        except (CalledProcessError, LookupError) as e:
+            threadsafe_call(nvim, write, nvim, e, error=True)
+        except Exception as e:
+            log.exception("%s", e)
+        else:
+            enqueue_event(_refresh, True)
 
-    return cont
+    pool.submit(c2)
+    return _removed(
+        nvim, state=state, settings=settings, unified=unified, selection=selection
+    )
 
 
 @rpc(blocking=False)
@@ -126,6 +168,6 @@ def _trash(
     """
 
     return _remove(
-        nvim, state=state, settings=settings, is_visual=is_visual, yeet=_sys_trash(nvim)
+        nvim, state=state, settings=settings, is_visual=is_visual, yeet=_sys_trash
     )
 
@@ -44,7 +44,7 @@ def _refocus(nvim: Nvim, state: State, settings: Settings, is_visual: bool) -> S
     new_state = new_root(
         nvim, state=state, settings=settings, new_cwd=cwd, indices=set()
     )
-    focus = new_state.root.path
+    focus = new_state.root_path
     return Stage(new_state, focus=focus)
 
 
@@ -64,7 +64,7 @@ def _change_dir(
         new_state = new_root(
             nvim, state=state, settings=settings, new_cwd=cwd, indices=set()
         )
-        focus = new_state.root.path
+        focus = new_state.root_path
         nvim.command(f"chdir {focus}")
         write(nvim, LANG("new cwd", cwd=str(focus)))
         return Stage(new_state, focus=focus)
@@ -106,7 +106,7 @@ def _change_focus_up(
             nvim,
             state=state,
             settings=settings,
-            new_cwd=state.root.path.parent,
+            new_cwd=state.root_path.parent,
             indices=set(),
         )
         return Stage(new_state, focus=node.path)
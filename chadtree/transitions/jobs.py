@@ -0,0 +1,198 @@
+from dataclasses import dataclass
+from pathlib import PurePath
+from threading import Lock, Thread
+from time import sleep
+from typing import AbstractSet, Callable, MutableMapping, Optional, Sequence, Tuple
+
+from pynvim import Nvim
+from pynvim.api import Buffer, Window
+from pynvim_pp.api import buf_set_lines, create_buf, win_close
+from pynvim_pp.atomic import Atomic
+from pynvim_pp.lib import threadsafe_call, write
+from pynvim_pp.logging import log
+from std2.locale import si_prefixed
+
+from ..consts import JOB_PROGRESS_INTERVAL
+from ..fs.jobs import Cancelled, Job, Progress, cancel_all, running, submit
+from ..fs.ops import exists
+from ..registry import enqueue_event, rpc
+from ..settings.localization import LANG
+from ..settings.types import Settings
+from ..state.next import forward
+from ..state.types import State
+from .types import Stage
+
+Finish = Callable[[Nvim, State, Settings], Optional[Stage]]
+
+
+@dataclass(frozen=True)
+class _Done:
+    name: str
+    paths: AbstractSet[PurePath]
+    finish: Finish
+    error: Optional[Exception]
+
+
+_lock = Lock()
+_done: MutableMapping[int, _Done] = {}
+_ticking = False
+_float: Optional[Tuple[Window, Buffer]] = None
+
+
+def _line(job: Job) -> str:
+    (files, nbytes), (total_files, total_bytes) = job.progress.report()
+    done = si_prefixed(nbytes, precision=1)
+    total = si_prefixed(total_bytes, precision=1)
+    size = f"{done}b / {total}b" if total_bytes else ""
+    return LANG(
+        "job_progress",
+        operation=job.name,
+        files=files,
+        total_files=total_files,
+        size=size,
+    ).rstrip()
+
+
+def _show(nvim: Nvim, jobs: Sequence[Job]) -> None:
+    """
+    Bottom right corner, one line per job, gone with the last job
+    """
+
+    global _float
+    if _float and not nvim.api.win_is_valid(_float[0]):
+        _float = None
+
+    if not jobs:
+        if _float:
+            win, _ = _float
+            win_close(nvim, win=win)
+            _float = None
+    else:
+        lines = tuple(map(_line, jobs))
+        atomic = Atomic()
+        for opt in ("columns", "lines", "cmdheight"):
+            atomic.get_option(opt)
+        for line in lines:
+            atomic.call_function("strdisplaywidth", (line,))
+        columns, rows, cmdheight, *widths = atomic.commit(nvim)
+
+        config = {
+            "relative": "editor",
+            "anchor": "SE",
+            "row": rows - cmdheight - 1,
+            "col": columns,
+            "width": max(widths),
+            "height": len(lines),
+        }
+        if _float:
+            win, buf = _float
+            nvim.api.win_set_config(win, config)
+        else:
+            buf = create_buf(
+                nvim, listed=False, scratch=True, wipe=True, nofile=True, noswap=True
+            )
+            win = nvim.api.open_win(
+                buf,
+                False,
+                {**config, "style": "minimal", "focusable": False, "noautocmd": True},
+            )
+            _float = (win, buf)
+        buf_set_lines(nvim, buf=buf, lo=0, hi=-1, lines=lines)
+
+
+def _tick(nvim: Nvim) -> None:
+    """
+    At most one ticker, it stops once there is nothing left to show
+
+    -> Its own thread, it mostly sleeps, `pool` is for the walks
+    """
+
+    global _ticking
+    with _lock:
+        if _ticking:
+            return
+        else:
+            _ticking = True
+
+    def cont() -> None:
+        global _ticking
+        try:
+            while True:
+                with _lock:
+                    jobs = running()
+                    _ticking = bool(jobs)
+                threadsafe_call(nvim, _show, nvim, jobs)
+                if not jobs:
+                    break
+                else:
+                    sleep(JOB_PROGRESS_INTERVAL)
+        except Exception as e:
+            with _lock:
+                _ticking = False
+            log.exception("%s", e)
+
+    Thread(target=cont, daemon=True).start()
+
+
+def start_job(
+    nvim: Nvim,
+    *,
+    name: str,
+    touches: AbstractSet[PurePath],
+    paths: AbstractSet[PurePath],
+    run: Callable[[Progress], None],
+    finish: Finish,
+) -> bool:
+    """
+    `run` happens off the UI thread, `finish` gets whatever `State` is current by then
+
+    -> `touches` are the sources & destinations, refused if a running job has them
+
+    -> `paths` are the folders to refresh if `run` fails or is cancelled
+    """
+
+    def done(job: Job, error: Optional[Exception]) -> None:
+        with _lock:
+            _done[job.uid] = _Done(name=name, paths=paths, finish=finish, error=error)
+        enqueue_event(_job_done, job.uid)
+
+    if not submit(name, paths=touches, run=run, done=done):
+        write(nvim, LANG("job_busy", operation=name), error=True)
+        return False
+    else:
+        _tick(nvim)
+        return True
+
+
+@rpc(blocking=False)
+def _job_done(
+    nvim: Nvim, state: State, settings: Settings, uid: int
+) -> Optional[Stage]:
+    with _lock:
+        done = _done.pop(uid, None)
+
+    if not done:
+        return None
+    elif done.error is None:
+        return done.finish(nvim, state, settings)
+    else:
+        if isinstance(done.error, Cancelled):
+            write(nvim, LANG("job_cancelled", operation=done.name), error=True)
+        else:
+            write(nvim, done.error, error=True)
+
+        selection = {s for s in state.selection if exists(s, follow=False)}
+        new_state = forward(
+            state, settings=settings, selection=selection, paths=done.paths
+        )
+        return Stage(new_state)
+
+
+@rpc(blocking=False)
+def _cancel(nvim: Nvim, state: State, settings: Settings) -> None:
+    """
+    Cancel running file operations
+    """
+
+    if not cancel_all():
+        write(nvim, LANG("no_jobs"), error=True)
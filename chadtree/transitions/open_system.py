@@ -4,16 +4,16 @@ from subprocess import DEVNULL, PIPE, CalledProcessError, check_call
 from typing import Sequence, cast
 
 from pynvim import Nvim
-from pynvim_pp.api import get_cwd
 from pynvim_pp.lib import threadsafe_call, write
 from pynvim_pp.logging import log
 
 from ..fs.types import Node
+from ..nvim.context import editor_ctx
 from ..registry import pool, rpc
 from ..settings.localization import LANG
 from ..settings.types import Settings
 from ..state.types import State
-from .shared.index import indices
+from .shared.index import ctx_indices
 
 
 def _open_gui(path: PurePath, cwd: PurePath) -> None:
@@ -33,11 +33,12 @@ def _open_sys(nvim: Nvim, state: State, settings: Settings, is_visual: bool) ->
     Open using finder / dolphin, etc
     """
 
-    node = next(indices(nvim, state=state, is_visual=is_visual), None)
+    ctx = editor_ctx(nvim)
+    node = next(ctx_indices(ctx, state=state, is_visual=is_visual), None)
     if not node:
         return None
     else:
-        cwd = PurePath(get_cwd(nvim))
+        cwd = ctx.cwd
 
         def cont() -> None:
             try:
@@ -0,0 +1,58 @@
+from typing import Iterator
+
+from pynvim import Nvim
+from pynvim_pp.api import buf_set_lines, buf_set_option, create_buf, win_close
+from pynvim_pp.float_win import list_floatwins, open_float_win
+
+from ..metrics import frame_stats, summaries
+from ..polling import poller
+from ..registry import rpc
+from ..settings.types import Settings
+from ..state.types import State
+
+
+def _report() -> Iterator[str]:
+    yield f"Frames     {frame_stats.frames}"
+    yield f"Events     {frame_stats.events}"
+    yield f"Coalesced  {frame_stats.coalesced}"
+    yield ""
+
+    paused, intervals = poller.intervals()
+    polls = "  ".join(f"{poll.name} {secs:.1f}s" for poll, secs in intervals.items())
+    yield f"Polling    {'paused' if paused else polls}"
+    yield ""
+
+    rows = tuple(
+        (
+            summary.event,
+            summary.phase,
+            str(summary.count),
+            *(f"{val * 1000:.2f}" for val in (summary.p50, summary.p95, summary.max)),
+        )
+        for summary in summaries()
+    )
+    header = ("Event", "Phase", "Count", "p50 ms", "p95 ms", "max ms")
+    widths = tuple(max(len(cell) for cell in col) for col in zip(header, *rows))
+    for row in (header, *rows):
+        event, phase, *nums = (
+            cell.ljust(width) if idx < 2 else cell.rjust(width)
+            for idx, (cell, width) in enumerate(zip(row, widths))
+        )
+        yield "  ".join((event, phase, *nums)).rstrip()
+
+
+@rpc(blocking=False)
+def _profile(nvim: Nvim, state: State, settings: Settings) -> None:
+    """
+    Show latency percentiles, per event & phase
+    """
+
+    for win in list_floatwins(nvim):
+        win_close(nvim, win=win)
+    lines = tuple(_report())
+    buf = create_buf(
+        nvim, listed=False, scratch=True, wipe=True, nofile=True, noswap=True
+    )
+    buf_set_lines(nvim, buf=buf, lo=0, hi=-1, lines=lines)
+    buf_set_option(nvim, buf=buf, key="modifiable", val=False)
+    open_float_win(nvim, margin=0, relsize=0.95, buf=buf)
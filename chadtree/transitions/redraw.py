@@ -1,93 +1,332 @@
+from dataclasses import dataclass
+from itertools import chain
 from pathlib import PurePath
-from typing import Optional, Sequence
-from uuid import uuid4
+from typing import (
+    Iterable,
+    Mapping,
+    MutableMapping,
+    MutableSequence,
+    MutableSet,
+    Optional,
+    Sequence,
+    Tuple,
+)
 
 from pynvim import Nvim
-from pynvim.api import NvimError
+from pynvim.api import NvimError, Window
 from pynvim.api.buffer import Buffer
-from pynvim_pp.api import buf_get_var, buf_line_count, cur_win, win_get_cursor
 from pynvim_pp.atomic import Atomic
-from pynvim_pp.operators import operator_marks
-from std2.difflib import trans_inplace
-from std2.pickle import DecodeError, decode
+from pynvim_pp.highlight import highlight
 
 from ..consts import FM_NAMESPACE
+from ..metrics import timed
+from ..nvim.decorations import Decorations, Hunk, decorate, provide_decorations
+from ..settings.types import Settings
 from ..state.types import State
-from ..view.types import Derived
-from .shared.wm import find_fm_windows
+from ..view.diff import Trans, trans_keyed
+from ..view.types import Badge, Derived, Highlight, HLcontext
+from .shared.wm import find_buffer_numbers, find_fm_windows, forget_layout
 
-_FM_HASH_VAR = f"CHAD_HASH_{uuid4()}"
+
+@dataclass(frozen=True)
+class _Ledger:
+    tick: int
+    keys: Sequence[PurePath]
+    lookup: Mapping[PurePath, int]
+    hashed: Sequence[str]
+
+
+@dataclass(frozen=True)
+class _BufCtx:
+    line_count: int
+    tick: int
+    marks: Tuple[Tuple[int, int], Tuple[int, int]]
+
+
+_LEDGERS: MutableMapping[int, _Ledger] = {}
+_DEFINED: MutableSet[str] = set()
 
 
 class UnrecoverableError(Exception):
     pass
 
 
-def _update(nvim: Nvim, buf: Buffer, ns: int, derived: Derived) -> Atomic:
-    n_hash = derived.hashed
-    try:
-        p_hash: Sequence[str] = decode(
-            Sequence[str], buf_get_var(nvim, buf=buf, key=_FM_HASH_VAR)
+def drawn_paths(buf: int) -> Optional[Sequence[PurePath]]:
+    """
+    What the user is actually looking at, which may lag behind `state.derived`
+    """
+
+    ledger = _LEDGERS.get(buf)
+    return ledger.keys if ledger else None
+
+
+def forget_highlights() -> None:
+    """
+    Groups in use get defined again, on the next draw
+    """
+
+    _DEFINED.clear()
+
+
+def forget_ledgers() -> None:
+    """
+    Every buffer gets drawn over in full, on the next draw
+    """
+
+    _LEDGERS.clear()
+
+
+def _keys(derived: Derived) -> Sequence[PurePath]:
+    return tuple(node.path for node in derived.node_row_lookup)
+
+
+@dataclass(frozen=True)
+class Plan:
+    state: State
+    keys: Sequence[PurePath]
+    trans: Mapping[int, Tuple[_Ledger, Sequence[Trans]]]
+
+
+def _diff(
+    ledger: _Ledger, derived: Derived, keys: Sequence[PurePath]
+) -> Sequence[Trans]:
+    with timed("diff"):
+        return trans_keyed(
+            ledger.keys,
+            src_hashes=ledger.hashed,
+            src_lookup=ledger.lookup,
+            dest_keys=keys,
+            dest_hashes=derived.hashed,
+            dest_lookup=derived.path_row_lookup,
+            unifying=10,
+        )
+
+
+def prepare(state: State) -> Plan:
+    """
+    Walk, render & diff against every ledger, without touching `nvim`
+
+    -> Safe to run off the `nvim` thread
+    """
+
+    derived = state.derived
+    keys = _keys(derived)
+    trans = {
+        number: (ledger, _diff(ledger, derived=derived, keys=keys))
+        for number, ledger in tuple(_LEDGERS.items())
+    }
+    return Plan(state=state, keys=keys, trans=trans)
+
+
+def _trans(buf: Buffer, plan: Plan, tick: int, line_count: int) -> Sequence[Trans]:
+    """
+    Only trust what we drew, if nobody else has touched the buffer since
+    """
+
+    derived = plan.state.derived
+    ledger = _LEDGERS.get(buf.number)
+    if ledger and ledger.tick == tick:
+        planned_ledger, trans = plan.trans.get(buf.number, (None, ()))
+        if planned_ledger is ledger:
+            return trans
+        else:
+            return _diff(ledger, derived=derived, keys=plan.keys)
+    else:
+        return (((0, line_count), (0, len(derived.lines))),)
+
+
+def _hl_groups(
+    context: HLcontext,
+    rows: Iterable[Tuple[Sequence[Highlight], Sequence[Badge]]],
+) -> Atomic:
+    """
+    Groups are only defined once a drawn row actually uses them
+    """
+
+    used = {
+        group
+        for highlights, badges in rows
+        for group in chain(
+            (hl.group for hl in highlights), (bdg.group for bdg in badges)
         )
-    except DecodeError:
-        p_hash = ("",)
+    }
+    groups = tuple(
+        context.groups[name]
+        for name in used - _DEFINED
+        # anything else is not ours to define
+        if name in context.groups
+    )
+    _DEFINED.update(group.name for group in groups)
+    return highlight(*groups) if groups else Atomic()
 
+
+def _update(
+    buf: Buffer,
+    ns: int,
+    plan: Plan,
+    tick: int,
+    line_count: int,
+    lazy: bool,
+    hl_context: HLcontext,
+) -> Atomic:
+    derived = plan.state.derived
     atomic = Atomic()
-    for (i1, i2), (j1, j2) in trans_inplace(src=p_hash, dest=n_hash, unifying=10):
+    drawn: MutableSequence[Tuple[Sequence[Highlight], Sequence[Badge]]] = []
+    decorations: MutableSequence[Decorations] = []
+    hunks: MutableSequence[Hunk] = []
+    for (i1, i2), (j1, j2) in _trans(buf, plan=plan, tick=tick, line_count=line_count):
         atomic.buf_clear_namespace(buf, ns, i1, i2)
         atomic.buf_set_lines(buf, i1, i2, True, derived.lines[j1:j2])
 
-        for idx, highlights in enumerate(derived.highlights[j1:j2], start=i1):
-            for hl in highlights:
-                atomic.buf_add_highlight(buf, ns, hl.group, idx, hl.begin, hl.end)
+        rows = tuple(zip(derived.highlights[j1:j2], derived.badges[j1:j2]))
+        drawn.extend(rows)
+        if lazy:
+            hunks.append((i1, i2, rows))
+        else:
+            for idx, (highlights, badges) in enumerate(rows, start=i1):
+                decorations.append((idx, highlights, badges))
+
+    if lazy:
+        provide_decorations(atomic, buf=buf, ns=ns, hunks=hunks)
+    else:
+        decorate(atomic, buf=buf, ns=ns, decorations=decorations)
+    return _hl_groups(hl_context, rows=drawn) + atomic
+
+
+def _fetch(
+    nvim: Nvim, bufs: Sequence[Buffer], wins: Sequence[Window]
+) -> Tuple[int, Window, Mapping[int, _BufCtx], Mapping[int, Tuple[int, int]]]:
+    """
+    Everything redraw needs to know, in a single round trip
+    """
+
+    atomic = Atomic()
+    atomic.create_namespace(FM_NAMESPACE)
+    atomic.get_current_win()
+    for buf in bufs:
+        atomic.buf_line_count(buf)
+        atomic.buf_get_changedtick(buf)
+        atomic.buf_get_mark(buf, "<")
+        atomic.buf_get_mark(buf, ">")
+    for win in wins:
+        atomic.win_get_cursor(win)
+
+    with timed("fetch"):
+        ns, cwin, *results = atomic.commit(nvim)
+    it = iter(results)
+
+    ctxs: MutableMapping[int, _BufCtx] = {}
+    for buf in bufs:
+        line_count, tick, (r1, c1), (r2, c2) = next(it), next(it), next(it), next(it)
+        ctxs[buf.number] = _BufCtx(
+            line_count=line_count, tick=tick, marks=((r1 - 1, c1), (r2 - 1, c2))
+        )
 
-        for idx, badges in enumerate(derived.badges[j1:j2], start=i1):
-            vtxt = tuple((bdg.text, bdg.group) for bdg in badges)
-            atomic.buf_set_virtual_text(buf, ns, idx, vtxt, {})
+    cursors: MutableMapping[int, Tuple[int, int]] = {}
+    for win in wins:
+        row, col = next(it)
+        cursors[win.handle] = row - 1, col
 
-    atomic.buf_set_var(buf, _FM_HASH_VAR, n_hash)
-    return atomic
+    return ns, cwin, ctxs, cursors
 
 
-def redraw(nvim: Nvim, state: State, focus: Optional[PurePath]) -> None:
-    derived, current = state.derived, state.current
+def _redraw(
+    nvim: Nvim,
+    plan: Plan,
+    settings: Settings,
+    focus: Optional[PurePath],
+    cached: bool,
+) -> None:
+    derived, current = plan.state.derived, plan.state.current
     focus_row = derived.path_row_lookup.get(focus) if focus else None
     current_row = derived.path_row_lookup.get(current) if current else None
 
-    cwin = cur_win(nvim)
-    ns = nvim.api.create_namespace(FM_NAMESPACE)
-
-    for win, buf in find_fm_windows(nvim):
-        p_count = buf_line_count(nvim, buf=buf)
-        n_count = len(state.derived.lines)
-        row, col = win_get_cursor(nvim, win=win)
-        (r1, c1), (r2, c2) = operator_marks(nvim, buf=buf, visual_type=None)
-
-        if focus_row is not None:
-            new_row: Optional[int] = focus_row + 1
-        elif win != cwin and current_row is not None:
-            new_row = current_row + 1
-        elif row >= n_count:
-            new_row = n_count
-        elif p_count != n_count:
-            new_row = row + 1
-        else:
-            new_row = None
+    fm_wins: MutableMapping[int, Tuple[Buffer, MutableSequence[Window]]] = {}
+    for win, buf in find_fm_windows(nvim, cached=cached):
+        _, wins = fm_wins.setdefault(buf.number, (buf, []))
+        wins.append(win)
+
+    # wiped buffers would otherwise keep their ledger for good
+    for number in _LEDGERS.keys() - find_buffer_numbers(nvim, cached=cached):
+        _LEDGERS.pop(number, None)
+
+    if not fm_wins:
+        return
+
+    bufs = tuple(buf for buf, _ in fm_wins.values())
+    all_wins = tuple(win for _, wins in fm_wins.values() for win in wins)
+    ns, cwin, ctxs, cursors = _fetch(nvim, bufs=bufs, wins=all_wins)
+    n_count = len(derived.lines)
+
+    for buf, wins in fm_wins.values():
+        ctx = ctxs[buf.number]
+        (r1, c1), (r2, c2) = ctx.marks
 
         a1 = Atomic()
         a1.buf_set_option(buf, "modifiable", True)
 
-        a2 = _update(nvim, buf=buf, ns=ns, derived=derived)
+        a2 = _update(
+            buf,
+            ns=ns,
+            plan=plan,
+            tick=ctx.tick,
+            line_count=ctx.line_count,
+            lazy=settings.view.lazy_decorations,
+            hl_context=settings.view.hl_context,
+        )
 
         a3 = Atomic()
         a3.buf_set_option(buf, "modifiable", False)
         a3.call_function("setpos", ("'<", (buf.number, r1 + 1, c1 + 1, 0)))
         a3.call_function("setpos", ("'>", (buf.number, r2 + 1, c2 + 1, 0)))
-        if new_row is not None:
-            a3.win_set_cursor(win, (new_row, col))
+
+        for win in wins:
+            row, col = cursors[win.handle]
+            if focus_row is not None:
+                new_row: Optional[int] = focus_row + 1
+            elif win != cwin and current_row is not None:
+                new_row = current_row + 1
+            elif row >= n_count:
+                new_row = n_count
+            elif ctx.line_count != n_count:
+                new_row = row + 1
+            else:
+                new_row = None
+
+            if new_row is not None:
+                a3.win_set_cursor(win, (new_row, col))
+
+        a3.buf_get_changedtick(buf)
 
         try:
-            (a1 + a2 + a3).commit(nvim)
+            with timed("commit"):
+                *_, tick = (a1 + a2 + a3).commit(nvim)
         except NvimError as e:
-            raise UnrecoverableError(e)
+            _LEDGERS.pop(buf.number, None)
+            _DEFINED.clear()
+            if cached:
+                raise
+            else:
+                raise UnrecoverableError(e)
+        else:
+            _LEDGERS[buf.number] = _Ledger(
+                tick=tick,
+                keys=plan.keys,
+                lookup=derived.path_row_lookup,
+                hashed=derived.hashed,
+            )
 
+
+def redraw(
+    nvim: Nvim, plan: Plan, settings: Settings, focus: Optional[PurePath]
+) -> None:
+    """
+    Only the `nvim` side of things, the heavy lifting is done in `prepare`
+    """
+
+    try:
+        _redraw(nvim, plan=plan, settings=settings, focus=focus, cached=True)
+    except NvimError:
+        # windows might have gone away since the layout was cached
+        forget_layout()
+        _redraw(nvim, plan=plan, settings=settings, focus=focus, cached=False)
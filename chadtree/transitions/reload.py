@@ -0,0 +1,96 @@
+from dataclasses import replace
+from typing import Any, Sequence, Tuple
+
+from pynvim import Nvim
+from pynvim_pp.lib import write
+from pynvim_pp.rpc import RpcSpec
+from std2.pickle import DecodeError
+
+from ..nvim.decorations import forget_provided
+from ..polling import poller
+from ..registry import rpc
+from ..settings.load import initial
+from ..settings.localization import init as init_locale
+from ..settings.types import Settings
+from ..state.next import forward
+from ..state.types import State
+from ..trace import enable, enabled, trace_path
+from .redraw import forget_highlights, forget_ledgers
+from .shared.wm import rebind_fm_buffers
+from .types import Stage
+
+
+@rpc(blocking=False)
+def _reload(nvim: Nvim, state: State, settings: Settings) -> Stage:
+    """
+    Re-read `g:chadtree_settings`
+    """
+
+    return Stage(state, reload=True)
+
+
+def _theme(settings: Settings) -> Tuple[Any, ...]:
+    view = settings.view
+    return (
+        view.hl_context.groups,
+        view.hl_context.particular_mappings,
+        view.icons,
+        view.use_icons,
+    )
+
+
+def _rendering(settings: Settings) -> Tuple[Any, ...]:
+    view = settings.view
+    return (_theme(settings), settings.ignores, view.sort_by, view.collation)
+
+
+def reload(
+    nvim: Nvim, state: State, prev: Settings, specs: Sequence[RpcSpec]
+) -> Tuple[State, Settings]:
+    """
+    Keep the walked tree & every toggle in `State`, only redo what changed
+    """
+
+    try:
+        loaded = initial(nvim, specs)
+    except DecodeError as e:
+        write(nvim, e, error=True)
+        return state, prev
+    else:
+        # by now, the current window might well be ours
+        actual = {
+            **loaded.win_actual_opts,
+            **{
+                key: val
+                for key, val in prev.win_actual_opts.items()
+                if key in loaded.win_actual_opts
+            },
+        }
+        settings = replace(loaded, win_actual_opts=actual)
+
+        if _theme(settings) != _theme(prev):
+            # names are by content, these only matter if `:colorscheme` cleared them
+            forget_highlights()
+        if (settings.keymap, settings.page_increment) != (
+            prev.keymap,
+            prev.page_increment,
+        ):
+            rebind_fm_buffers(nvim, prev=prev, settings=settings)
+        if settings.lang != prev.lang:
+            init_locale(settings.lang)
+        if settings.polling != prev.polling:
+            poller.configure(settings.polling)
+        if settings.trace and not enabled():
+            enable(trace_path(use_xdg=settings.xdg))
+
+        lazy = settings.view.lazy_decorations != prev.view.lazy_decorations
+        if lazy:
+            # neither kind of decoration knows of the other, so start over
+            forget_provided(nvim)
+            forget_ledgers()
+
+        if not lazy and _rendering(settings) == _rendering(prev):
+            return state, settings
+        else:
+            # same root, so only the render is redone, not the walk
+            return forward(state, settings=settings), settings
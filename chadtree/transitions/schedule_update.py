@@ -3,16 +3,28 @@ from typing import Optional
 from pynvim import Nvim
 from pynvim.api.common import NvimError
 
-from ..registry import rpc
+from ..registry import background, rpc
 from ..settings.types import Settings
 from ..state.types import State
+from .shared.current import new_root
+from .shared.dormant import check_dormant, owed_cwd
 from .shared.refresh import refresh
 from .types import Stage
 
 
+@background
 @rpc(blocking=False)
 def schedule_update(nvim: Nvim, state: State, settings: Settings) -> Optional[Stage]:
+    if check_dormant(nvim):
+        return None
+
     try:
+        owed = owed_cwd()
+        if owed and owed != state.root_path:
+            # shown again by some other means after a dormant `DirChanged`
+            state = new_root(
+                nvim, state=state, settings=settings, new_cwd=owed, indices=set()
+            )
         stage = refresh(nvim, state=state, settings=settings)
         return Stage(stage.state, focus=stage.focus)
     except NvimError:
@@ -4,7 +4,6 @@ from typing import AbstractSet, Optional
 from pynvim import Nvim
 from std2.pathlib import is_relative_to, longest_common_path
 
-from ...fs.cartographer import new
 from ...fs.ops import ancestors
 from ...settings.types import Settings
 from ...state.next import forward
@@ -20,7 +19,7 @@ def new_current_file(
     """
 
     parents = ancestors(current)
-    if state.root.path in parents:
+    if state.root_path in parents:
         paths: AbstractSet[PurePath] = parents if state.follow else set()
         index = state.index | paths
         new_state = forward(
@@ -38,18 +37,21 @@ def new_root(
     new_cwd: PurePath,
     indices: AbstractSet[PurePath],
 ) -> State:
+    """
+    The walk is deferred, it happens off the `nvim` thread in `prepare`
+    """
+
     index = state.index | ancestors(new_cwd) | {new_cwd} | indices
-    root = new(new_cwd, index=index)
-    selection = {path for path in state.selection if root.path in ancestors(path)}
+    selection = {path for path in state.selection if new_cwd in ancestors(path)}
     return forward(
-        state, settings=settings, root=root, selection=selection, index=index
+        state, settings=settings, cwd=new_cwd, selection=selection, index=index
     )
 
 
 def maybe_path_above(
     nvim: Nvim, state: State, settings: Settings, path: PurePath
 ) -> Optional[State]:
-    root = state.root.path
+    root = state.root_path
     if is_relative_to(path, root):
         return None
     else:
@@ -0,0 +1,53 @@
+from pathlib import PurePath
+from threading import Event
+from typing import Optional
+
+from pynvim import Nvim
+
+from .wm import find_fm_windows
+
+_dormant = Event()
+_cwd: Optional[PurePath] = None
+
+
+def asleep() -> bool:
+    return _dormant.is_set()
+
+
+def check_dormant(nvim: Nvim) -> bool:
+    """
+    No FM window anywhere, nothing needs to be kept up to date
+    """
+
+    if next(find_fm_windows(nvim, cached=True), None) is None:
+        _dormant.set()
+        return True
+    else:
+        # shown again by some other means, the next refresh catches up by itself
+        _dormant.clear()
+        return False
+
+
+def wake() -> bool:
+    """
+    -> Whether we were dormant, and so owe a catch up refresh
+    """
+
+    woke = _dormant.is_set()
+    _dormant.clear()
+    return woke
+
+
+def owe_cwd(cwd: PurePath) -> None:
+    """
+    `DirChanged` while dormant, followed once awake
+    """
+
+    global _cwd
+    _cwd = cwd
+
+
+def owed_cwd() -> Optional[PurePath]:
+    global _cwd
+    cwd, _cwd = _cwd, None
+    return cwd
@@ -0,0 +1,29 @@
+from functools import wraps
+from typing import Any, Callable, Optional
+
+from pynvim import Nvim
+
+from ...settings.types import Settings
+from ...state.types import State
+from ..types import Stage
+
+_Handler = Callable[..., Optional[Stage]]
+
+
+def versioned(handler: _Handler) -> _Handler:
+    """
+    For results of background work, sent back with the `generation` they were based on
+
+    -> Stale results are dropped, current ones are forwarded onto the latest state
+    """
+
+    @wraps(handler)
+    def cont(
+        nvim: Nvim, state: State, settings: Settings, generation: int, *args: Any
+    ) -> Optional[Stage]:
+        if generation != state.generation:
+            return None
+        else:
+            return handler(nvim, state, settings, *args)
+
+    return cont
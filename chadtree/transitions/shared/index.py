@@ -1,38 +1,48 @@
 from typing import Iterator, Optional
 
 from pynvim.api import Nvim
-from pynvim_pp.api import cur_win, win_get_buf, win_get_cursor
-from pynvim_pp.operators import operator_marks
 
+from ...consts import FM_FILETYPE
+from ...fs.cartographer import find
 from ...fs.types import Node
+from ...nvim.context import editor_ctx
+from ...nvim.types import EditorCtx
 from ...state.types import State
-from .wm import is_fm_buffer
-
-
-def _row_index(state: State, row: int) -> Optional[Node]:
-    if (row >= 0) and (row < len(state.derived.node_row_lookup)):
-        return state.derived.node_row_lookup[row]
+from ..redraw import drawn_paths
+
+
+def _row_index(state: State, buf: int, row: int) -> Optional[Node]:
+    paths = drawn_paths(buf)
+    if paths is None:
+        if (row >= 0) and (row < len(state.derived.node_row_lookup)):
+            return state.derived.node_row_lookup[row]
+        else:
+            return None
+    elif (row >= 0) and (row < len(paths)):
+        return find(state.root, paths[row])
     else:
         return None
 
 
-def indices(nvim: Nvim, state: State, is_visual: bool) -> Iterator[Node]:
-    win = cur_win(nvim)
-    buf = win_get_buf(nvim, win=win)
-
-    if not is_fm_buffer(nvim, buf=buf):
+def ctx_indices(ctx: EditorCtx, state: State, is_visual: bool) -> Iterator[Node]:
+    if ctx.filetype != FM_FILETYPE:
         return None
     else:
-        row, _ = win_get_cursor(nvim, win=win)
-        node = _row_index(state, row)
+        row, _ = ctx.cursor
+        node = _row_index(state, buf=ctx.buf, row=row)
         if node:
             yield node
 
         if is_visual:
-            (row1, _), (row2, _) = operator_marks(nvim, buf=buf, visual_type=None)
+            (row1, _), (row2, _) = ctx.marks
 
             for r in range(row1, row2 + 1):
                 if r != row:
-                    node = _row_index(state, r)
+                    node = _row_index(state, buf=ctx.buf, row=r)
                     if node:
                         yield node
+
+
+def indices(nvim: Nvim, state: State, is_visual: bool) -> Iterator[Node]:
+    ctx = editor_ctx(nvim)
+    return ctx_indices(ctx, state=state, is_visual=is_visual)
@@ -18,7 +18,7 @@ def refresh(
     nvim: Nvim, state: State, settings: Settings, vc: Optional[VCStatus] = None
 ) -> Stage:
     current = find_current_buffer_name(nvim)
-    cwd = state.root.path
+    cwd = state.root_path
     paths = {cwd}
     new_current = current if cwd in ancestors(current) else None
 
@@ -27,7 +27,7 @@ def refresh(
     parent_paths: AbstractSet[PurePath] = ancestors(current) if state.follow else set()
     new_index = index if new_current else index | parent_paths
 
-    qf = quickfix(nvim)
+    qf = quickfix(nvim, prev=state.qf)
     new_state = forward(
         state,
         settings=settings,
@@ -9,24 +9,31 @@ from pynvim_pp.api import (
     buf_set_option,
     create_buf,
     cur_buf,
-    cur_tab,
     cur_win,
-    list_bufs,
-    list_wins,
     set_cur_win,
-    tab_list_wins,
     win_get_buf,
-    win_get_option,
     win_set_option,
 )
+from pynvim_pp.atomic import Atomic
 from pynvim_pp.hold import hold_win_pos
 from pynvim_pp.keymap import Keymap
 from std2.lex import escape
 
 from ...consts import FM_FILETYPE
 from ...fs.ops import ancestors
+from ...nvim.layout import layout
+from ...nvim.types import Layout, WinInfo
 from ...settings.types import Settings
 
+_CACHED: Optional[Layout] = None
+
+_DEL_KEYMAPS = """
+local buf, maps = ...
+for _, map in ipairs(maps) do
+  pcall(vim.api.nvim_buf_del_keymap, buf, map[1], map[2])
+end
+"""
+
 
 def escape_file_path(path: PurePath) -> str:
     rules = {"\\": "\\", "$": "\\", "%": "\\", "#": "\\"}
@@ -43,67 +50,90 @@ def is_fm_window(nvim: Nvim, win: Window) -> bool:
     return is_fm_buffer(nvim, buf=buf)
 
 
-def find_windows_in_tab(nvim: Nvim, no_secondary: bool) -> Iterator[Window]:
-    def key_by(win: Window) -> Tuple[int, int]:
+def forget_layout() -> None:
+    """
+    Windows or buffers may have come & gone
+    """
+
+    global _CACHED
+    _CACHED = None
+
+
+def _layout(nvim: Nvim, cached: bool) -> Layout:
+    """
+    Only for read only callers, anything that changes the layout fetches a fresh one
+    """
+
+    global _CACHED
+    if cached and _CACHED:
+        return _CACHED
+    else:
+        lo = layout(nvim)
+        if cached:
+            _CACHED = lo
+        return lo
+
+
+def _windows_in_tab(lo: Layout, no_secondary: bool) -> Iterator[WinInfo]:
+    def key_by(info: WinInfo) -> Tuple[int, int]:
         """
         -> sort by row, then col
         """
 
-        row, col = nvim.funcs.win_screenpos(win.number)
+        row, col = info.pos
         return col, row
 
-    tab = cur_tab(nvim)
-    wins = tab_list_wins(nvim, tab=tab)
-
-    for win in sorted(wins, key=key_by):
-        is_preview: bool = win_get_option(nvim, win=win, key="previewwindow")
-        buf = win_get_buf(nvim, win)
-        ft = buf_filetype(nvim, buf=buf)
-        is_secondary = is_preview or ft == "qf"
+    for info in sorted((info for info in lo.wins if info.in_tab), key=key_by):
+        is_secondary = info.preview or info.buf.filetype == "qf"
         if not is_secondary or not no_secondary:
-            yield win
+            yield info
+
+
+def find_windows_in_tab(nvim: Nvim, no_secondary: bool) -> Iterator[Window]:
+    for info in _windows_in_tab(layout(nvim), no_secondary=no_secondary):
+        yield info.win
 
 
-def find_fm_windows(nvim: Nvim) -> Iterator[Tuple[Window, Buffer]]:
-    for win in list_wins(nvim):
-        buf = win_get_buf(nvim, win=win)
-        if is_fm_buffer(nvim, buf=buf):
-            yield win, buf
+def find_fm_windows(
+    nvim: Nvim, cached: bool = False
+) -> Iterator[Tuple[Window, Buffer]]:
+    for info in _layout(nvim, cached=cached).wins:
+        if info.buf.filetype == FM_FILETYPE:
+            yield info.win, info.buf.buf
 
 
 def find_fm_windows_in_tab(nvim: Nvim) -> Iterator[Window]:
-    for win in find_windows_in_tab(nvim, no_secondary=True):
-        buf = win_get_buf(nvim, win=win)
-        if is_fm_buffer(nvim, buf=buf):
-            yield win
+    for info in _windows_in_tab(layout(nvim), no_secondary=True):
+        if info.buf.filetype == FM_FILETYPE:
+            yield info.win
 
 
 def find_non_fm_windows_in_tab(nvim: Nvim) -> Iterator[Window]:
-    for win in find_windows_in_tab(nvim, no_secondary=True):
-        buf = win_get_buf(nvim, win=win)
-        if not is_fm_buffer(nvim, buf=buf):
-            yield win
+    for info in _windows_in_tab(layout(nvim), no_secondary=True):
+        if info.buf.filetype != FM_FILETYPE:
+            yield info.win
 
 
 def find_window_with_file_in_tab(nvim: Nvim, file: PurePath) -> Iterator[Window]:
-    for win in find_windows_in_tab(nvim, no_secondary=True):
-        buf = win_get_buf(nvim, win=win)
-        name = PurePath(buf_name(nvim, buf=buf))
-        if name == file:
-            yield win
+    for info in _windows_in_tab(layout(nvim), no_secondary=True):
+        if info.buf.name == file:
+            yield info.win
 
 
 def find_fm_buffers(nvim: Nvim) -> Iterator[Buffer]:
-    for buf in list_bufs(nvim, listed=True):
-        if is_fm_buffer(nvim, buf=buf):
-            yield buf
+    for info in layout(nvim).bufs:
+        if info.listed and info.filetype == FM_FILETYPE:
+            yield info.buf
+
+
+def find_buffer_numbers(nvim: Nvim, cached: bool = False) -> AbstractSet[int]:
+    return {info.buf.number for info in _layout(nvim, cached=cached).bufs}
 
 
 def find_buffers_with_file(nvim: Nvim, file: PurePath) -> Iterator[Buffer]:
-    for buf in list_bufs(nvim, listed=True):
-        name = PurePath(buf_name(nvim, buf=buf))
-        if name == file:
-            yield buf
+    for info in layout(nvim).bufs:
+        if info.listed and info.name == file:
+            yield info.buf
 
 
 def find_current_buffer_name(nvim: Nvim) -> PurePath:
@@ -112,13 +142,16 @@ def find_current_buffer_name(nvim: Nvim) -> PurePath:
     return name
 
 
-def new_fm_buffer(nvim: Nvim, settings: Settings) -> Buffer:
-    buf = create_buf(
-        nvim, listed=False, scratch=True, wipe=False, nofile=True, noswap=True
-    )
-    buf_set_option(nvim, buf=buf, key="modifiable", val=False)
-    buf_set_option(nvim, buf=buf, key="filetype", val=FM_FILETYPE)
+def _lhs(settings: Settings) -> AbstractSet[Tuple[str, str]]:
+    return {("n", "{"), ("n", "}")} | {
+        (mode, mapping)
+        for mappings in settings.keymap.values()
+        for mapping in mappings
+        for mode in ("n", "v")
+    }
+
 
+def _keymap(settings: Settings) -> Keymap:
     km = Keymap()
     km.n("{") << f"{settings.page_increment}<up>"
     km.n("}") << f"{settings.page_increment}<down>"
@@ -132,11 +165,35 @@ def new_fm_buffer(nvim: Nvim, settings: Settings) -> Buffer:
                 km.v(mapping, noremap=True, silent=True, nowait=True)
                 << f"<esc><cmd>lua {function}(true)<cr>"
             )
+    return km
 
-    km.drain(buf=buf).commit(nvim)
+
+def new_fm_buffer(nvim: Nvim, settings: Settings) -> Buffer:
+    buf = create_buf(
+        nvim, listed=False, scratch=True, wipe=False, nofile=True, noswap=True
+    )
+    buf_set_option(nvim, buf=buf, key="modifiable", val=False)
+    buf_set_option(nvim, buf=buf, key="filetype", val=FM_FILETYPE)
+    _keymap(settings).drain(buf=buf).commit(nvim)
     return buf
 
 
+def rebind_fm_buffers(nvim: Nvim, prev: Settings, settings: Settings) -> None:
+    """
+    Swap the mappings of every fm buffer in place, no need to recreate them
+    """
+
+    maps = tuple(_lhs(prev))
+    atomic = Atomic()
+    # fm buffers are unlisted, so not `find_fm_buffers`
+    for info in layout(nvim).bufs:
+        if info.filetype == FM_FILETYPE:
+            # not every old lhs is necessarily mapped, one failure would abort the batch
+            atomic.exec_lua(_DEL_KEYMAPS, (info.buf, maps))
+            atomic = atomic + _keymap(settings).drain(buf=info.buf)
+    atomic.commit(nvim)
+
+
 def new_window(
     nvim: Nvim,
     *,
@@ -171,14 +228,14 @@ def resize_fm_windows(nvim: Nvim, width: int) -> None:
 def kill_buffers(
     nvim: Nvim, paths: AbstractSet[PurePath], reopen: Mapping[PurePath, PurePath]
 ) -> None:
-    active = (
-        {win_get_buf(nvim, win=win): win for win in find_non_fm_windows_in_tab(nvim)}
-        if reopen
-        else {}
-    )
-
-    for buf in list_bufs(nvim, listed=True):
-        name = PurePath(buf_name(nvim, buf=buf))
+    lo = layout(nvim)
+    active = {
+        info.buf.buf: info.win
+        for info in _windows_in_tab(lo, no_secondary=True)
+        if info.buf.filetype != FM_FILETYPE
+    }
+
+    for buf, name in ((info.buf, info.name) for info in lo.bufs if info.listed):
         buf_paths = ancestors(name) | {name}
 
         if not buf_paths.isdisjoint(paths):
@@ -19,13 +19,15 @@ from pynvim_pp.lib import write
 from std2.argparse import ArgparseError, ArgParser
 
 from ..fs.ops import exists, new
-from ..registry import rpc
+from ..registry import enqueue_event, rpc
 from ..settings.localization import LANG
 from ..settings.types import Settings
 from ..state.types import State
 from ..version_ctl.git import root as version_ctl_toplv
 from .shared.current import maybe_path_above, new_current_file, new_root
+from .shared.dormant import owed_cwd, wake
 from .shared.open_file import open_file
+from .shared.refresh import refresh
 from .shared.wm import (
     find_current_buffer_name,
     find_fm_buffers,
@@ -36,6 +38,7 @@ from .shared.wm import (
     resize_fm_windows,
 )
 from .types import ClickType, Stage
+from .version_ctl import vc_refresh
 
 
 @dataclass(frozen=True)
@@ -127,10 +130,17 @@ def _open(
         write(nvim, e, error=True)
         return None
     else:
+        woke, owed = wake(), owed_cwd()
+        if owed and owed != state.root_path:
+            # `DirChanged` while no FM window was shown
+            state = new_root(
+                nvim, state=state, settings=settings, new_cwd=owed, indices=set()
+            )
+
         if opts.version_ctl:
             if which("git"):
                 try:
-                    cwd = version_ctl_toplv(state.root.path)
+                    cwd = version_ctl_toplv(state.root_path)
                     new_state = new_root(
                         nvim, state=state, settings=settings, new_cwd=cwd, indices=set()
                     )
@@ -143,6 +153,11 @@ def _open(
         else:
             new_state = state
 
+        if woke:
+            # nothing was kept up to date while no FM window was shown
+            new_state = refresh(nvim, state=new_state, settings=settings).state
+            enqueue_event(vc_refresh)
+
         if opts.path:
             path = (
                 opts.path
@@ -18,4 +18,6 @@ class ClickType(Enum):
 class Stage:
     state: State
     focus: Optional[PurePath] = None
+    # `Settings` belong to the client, ask it to re-read them
+    reload: bool = False
 
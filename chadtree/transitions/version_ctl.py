@@ -5,31 +5,37 @@ from pynvim import Nvim
 from pynvim_pp.api import get_cwd
 from pynvim_pp.logging import log
 
-from ..registry import enqueue_event, pool, rpc
+from ..metrics import attribute
+from ..registry import background, enqueue_event, pool, rpc
 from ..settings.types import Settings
 from ..state.next import forward
 from ..state.types import State
 from ..version_ctl.git import status
 from ..version_ctl.types import VCStatus
+from .shared.dormant import check_dormant
+from .shared.generation import versioned
 from .types import Stage
 
 _lock = Lock()
 
 
+@background
 @rpc(blocking=False)
+@versioned
 def _set_vc(nvim: Nvim, state: State, settings: Settings, vc: VCStatus) -> Stage:
     new_state = forward(state, settings=settings, vc=vc)
     return Stage(new_state)
 
 
+@background
 @rpc(blocking=False)
 def vc_refresh(nvim: Nvim, state: State, settings: Settings) -> None:
     """
     VC Refresh
     """
 
-    if state.enable_vc:
-        cwd = PurePath(get_cwd(nvim))
+    if state.enable_vc and not check_dormant(nvim):
+        cwd, generation = PurePath(get_cwd(nvim)), state.generation
 
         def cont() -> None:
             if _lock.locked():
@@ -37,11 +43,12 @@ def vc_refresh(nvim: Nvim, state: State, settings: Settings) -> None:
             else:
                 with _lock:
                     try:
-                        vc = status(cwd)
+                        with attribute(vc_refresh.name):
+                            vc = status(cwd)
                     except Exception as e:
                         log.exception("%s", e)
                     else:
-                        enqueue_event(_set_vc, vc)
+                        enqueue_event(_set_vc, generation, vc)
 
         pool.submit(cont)
 
@@ -21,6 +21,7 @@ from typing import (
 from std2.string import removeprefix, removesuffix
 
 from ..fs.ops import ancestors
+from ..metrics import timed
 from ..registry import pool
 from .types import VCStatus
 
@@ -148,6 +149,7 @@ def _parse(root: PurePath, stats: Iterable[Tuple[str, PurePath]]) -> VCStatus:
     return VCStatus(ignored=ignored, status=trimmed)
 
 
+@timed("vc")
 def status(cwd: PurePath) -> VCStatus:
     if which("git"):
         try:
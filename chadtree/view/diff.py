@@ -0,0 +1,96 @@
+from typing import (
+    Hashable,
+    Iterator,
+    Mapping,
+    MutableSequence,
+    Sequence,
+    Tuple,
+    TypeVar,
+)
+
+K = TypeVar("K", bound=Hashable)
+
+Trans = Tuple[Tuple[int, int], Tuple[int, int]]
+
+
+def _anchors(
+    src_keys: Sequence[K],
+    src_hashes: Sequence[str],
+    src_lookup: Mapping[K, int],
+    dest_keys: Sequence[K],
+    dest_hashes: Sequence[str],
+    dest_lookup: Mapping[K, int],
+) -> Iterator[Tuple[int, int]]:
+    """
+    Rows that are identical by both key & content, in ascending order on both sides
+
+    -> Every step advances at least one side, so O(n + m)
+    """
+
+    i, j = 0, 0
+    n, m = len(src_keys), len(dest_keys)
+    while i < n and j < m:
+        s_key, d_key = src_keys[i], dest_keys[j]
+        if s_key == d_key:
+            if src_hashes[i] == dest_hashes[j]:
+                yield i, j
+            i, j = i + 1, j + 1
+        elif dest_lookup.get(s_key, -1) < j:
+            i += 1
+        elif src_lookup.get(d_key, -1) < i:
+            j += 1
+        else:
+            i += 1
+
+
+def trans_keyed(
+    src_keys: Sequence[K],
+    src_hashes: Sequence[str],
+    src_lookup: Mapping[K, int],
+    dest_keys: Sequence[K],
+    dest_hashes: Sequence[str],
+    dest_lookup: Mapping[K, int],
+    unifying: int,
+) -> Sequence[Trans]:
+    """
+    Same contract as `std2.difflib.trans_inplace`:
+
+    -> src[i1:i2] = dest[j1:j2], applied in order
+
+    -> Linear by construction, how it compares in practice is up to `bench.diff`
+    """
+
+    hunks: MutableSequence[Trans] = []
+    p_i, p_j = -1, -1
+    for i, j in _anchors(
+        src_keys,
+        src_hashes=src_hashes,
+        src_lookup=src_lookup,
+        dest_keys=dest_keys,
+        dest_hashes=dest_hashes,
+        dest_lookup=dest_lookup,
+    ):
+        if i - p_i > 1 or j - p_j > 1:
+            hunks.append(((p_i + 1, i), (p_j + 1, j)))
+        p_i, p_j = i, j
+
+    if p_i + 1 < len(src_keys) or p_j + 1 < len(dest_keys):
+        hunks.append(((p_i + 1, len(src_keys)), (p_j + 1, len(dest_keys))))
+
+    unified: MutableSequence[Trans] = []
+    for hunk in hunks:
+        if unified:
+            (i1, i2), (j1, j2) = unified[-1]
+            (ii1, ii2), (jj1, jj2) = hunk
+            if ii1 - i2 < unifying:
+                unified[-1] = (i1, ii2), (j1, jj2)
+                continue
+        unified.append(hunk)
+
+    offset = 0
+    inplace: MutableSequence[Trans] = []
+    for (i1, i2), (j1, j2) in unified:
+        inplace.append(((i1 + offset, i2 + offset), (j1, j2)))
+        offset += (j2 - j1) - (i2 - i1)
+
+    return inplace
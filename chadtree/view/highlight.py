@@ -1,5 +1,5 @@
-from typing import Iterator, Mapping, Tuple
-from uuid import uuid4
+from hashlib import blake2b
+from typing import AbstractSet, Iterator, Mapping, Optional, Tuple
 
 from pynvim_pp.highlight import HLgroup
 
@@ -18,10 +18,34 @@ LEGAL_CTERM = {
 LEGAL_CTERM_COLOURS = range(8)
 
 
+def hl_group(
+    name_prefix: str,
+    *,
+    cterm: AbstractSet[str] = frozenset(),
+    ctermfg: Optional[int] = None,
+    ctermbg: Optional[int] = None,
+    guifg: Optional[str] = None,
+    guibg: Optional[str] = None,
+) -> HLgroup:
+    """
+    Named after its attributes, so identical groups collapse into one
+    """
+
+    attrs = (sorted(cterm), ctermfg, ctermbg, guifg, guibg)
+    digest = blake2b(repr(attrs).encode(), digest_size=8).hexdigest()
+    return HLgroup(
+        name=f"{FM_HL_PREFIX}_{name_prefix}_{digest}",
+        cterm=cterm,
+        ctermfg=ctermfg,
+        ctermbg=ctermbg,
+        guifg=guifg,
+        guibg=guibg,
+    )
+
+
 def gen_hl(name_prefix: str, mapping: Mapping[str, str]) -> Mapping[str, HLgroup]:
     def cont() -> Iterator[Tuple[str, HLgroup]]:
         for key, val in mapping.items():
-            name = f"{FM_HL_PREFIX}_{name_prefix}_{uuid4().hex}"
-            yield key, HLgroup(name=name, guifg=val)
+            yield key, hl_group(name_prefix, guifg=val)
 
     return {k: v for k, v in cont()}
@@ -17,6 +17,7 @@ from std2.types import never
 from ..consts import FM_HL_PREFIX
 from .highlight import gen_hl
 from .ls_colours import parse_lsc
+from .suffixes import SuffixTrie
 from .types import HLcontext, HLGroups
 
 T = TypeVar("T")
@@ -88,23 +89,24 @@ def load_theme(
 
     icon_exts = gen_hl(FM_HL_PREFIX, mapping=artifact.icon_colours.github)
 
-    groups = tuple(
-        chain(
+    groups = {
+        group.name: group
+        for group in chain(
             icon_exts.values(),
             mode_pre.values(),
             mode_post.values(),
             ext_exact.values(),
             name_exact.values(),
             name_glob.values(),
-        ),
-    )
+        )
+    }
 
     context = HLcontext(
         groups=groups,
-        icon_exts=_trans(icon_exts),
+        icon_exts=SuffixTrie(_trans(icon_exts)),
         mode_pre=_trans(mode_pre),
         mode_post=_trans(mode_post),
-        ext_exact=_trans(ext_exact),
+        ext_exact=SuffixTrie(_trans(ext_exact)),
         name_exact=_trans(name_exact),
         name_glob=_trans(name_glob),
         particular_mappings=particular_mappings,
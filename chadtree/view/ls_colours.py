@@ -11,12 +11,12 @@ from typing import (
     Tuple,
     Union,
 )
-from uuid import uuid4
 
 from pynvim_pp.highlight import HLgroup
 from std2.coloursys import rgb_to_hex
 
-from ..consts import FM_HL_PREFIX
+from .highlight import hl_group
+from .suffixes import GLOB_CHARS
 from .types import Mode
 
 
@@ -234,7 +234,6 @@ def _parse_styling(codes: str) -> _Styling:
 
 def _parseHLGroup(styling: _Styling, discrete_colours: Mapping[str, str]) -> HLgroup:
     fg, bg = styling.foreground, styling.background
-    name = f"{FM_HL_PREFIX}_ls_{uuid4().hex}"
     cterm = {
         style
         for style in (_HL_STYLE_TABLE.get(style) for style in styling.styles)
@@ -252,8 +251,8 @@ def _parseHLGroup(styling: _Styling, discrete_colours: Mapping[str, str]) -> HLg
         if isinstance(bg, _Colour)
         else (discrete_colours.get(bg.name) if isinstance(bg, _AnsiColour) else None)
     )
-    group = HLgroup(
-        name=name,
+    group = hl_group(
+        "ls",
         cterm=cterm,
         ctermfg=ctermfg,
         ctermbg=ctermbg,
@@ -287,8 +286,11 @@ def parse_lsc(ls_colours: str, discrete_colours: Mapping[str, str]) -> LSC:
         if val
     }
 
+    # `*.tar.gz`, `*rc`, `*~` are all plain suffixes, no need to `fnmatch` them
     _ext_keys = tuple(
-        key for key in hl_lookup if key.startswith("*.") and key.count(".") == 1
+        key
+        for key in hl_lookup
+        if key.startswith("*") and key[1:] and GLOB_CHARS.isdisjoint(key[1:])
     )
     exts = {key[1:]: hl_lookup.pop(key) for key in _ext_keys}
 
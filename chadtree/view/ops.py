@@ -6,7 +6,7 @@ from ..state.types import State
 
 
 def display_path(path: PurePath, state: State) -> str:
-    raw = relpath(path, start=state.root.path)
+    raw = relpath(path, start=state.root_path)
     name = raw.replace(linesep, r"\n")
     if Path(path).is_dir():
         return f"{name}{sep}"
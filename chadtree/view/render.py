@@ -1,46 +1,32 @@
-from enum import IntEnum, auto
 from fnmatch import fnmatch
-from locale import strxfrm
+from hashlib import blake2b
 from os import linesep
 from os.path import sep
 from pathlib import PurePath
-from typing import Any, Callable, Iterator, Optional, Sequence, Tuple, cast
-
-from std2.types import never
+from typing import Callable, Iterator, Optional, Sequence, Tuple, cast
 
 from ..fs.cartographer import is_dir, user_ignored
 from ..fs.types import Mode, Node
+from ..metrics import timed
 from ..settings.types import Settings
 from ..state.types import FilterPattern, Index, QuickFix, Selection
 from ..version_ctl.types import VCStatus
-from .types import Badge, Derived, Highlight, Sortby
-
-
-class _CompVals(IntEnum):
-    FOLDER = auto()
-    FILE = auto()
-
+from .sort import sorted_children
+from .types import Badge, Derived, Highlight
 
 _Render = Tuple[str, Sequence[Highlight], Sequence[Badge]]
 _NRender = Tuple[Node, str, Sequence[Highlight], Sequence[Badge]]
 
 
-def _gen_comp(sortby: Sequence[Sortby]) -> Callable[[Node], Any]:
-    def comp(node: Node) -> Sequence[Any]:
-        def cont() -> Iterator[Any]:
-            for sb in sortby:
-                if sb is Sortby.is_folder:
-                    yield _CompVals.FOLDER if is_dir(node) else _CompVals.FILE
-                elif sb is Sortby.ext:
-                    yield strxfrm(node.path.suffix),
-                elif sb is Sortby.file_name:
-                    yield strxfrm(node.path.name)
-                else:
-                    never(sb)
-
-        return tuple(cont())
+def _fingerprint(
+    line: str, highlights: Sequence[Highlight], badges: Sequence[Badge]
+) -> str:
+    """
+    Stable across processes, unlike `hash()`
+    """
 
-    return comp
+    text = repr((line, highlights, badges)).encode("UTF-8", "surrogateescape")
+    return blake2b(text, digest_size=16).hexdigest()
 
 
 def _vc_ignored(node: Node, vc: VCStatus) -> bool:
@@ -61,6 +47,7 @@ def _paint(
     current: Optional[PurePath],
 ) -> Callable[[Node, int], Optional[_Render]]:
     icons = settings.view.icons
+    glyph_exts = settings.view.icon_glyph_exts
     context = settings.view.hl_context
     (
         particular_mappings,
@@ -84,7 +71,7 @@ def _paint(
         if ignored:
             return particular_mappings.ignored
         else:
-            return icon_exts.get(node.path.suffix)
+            return icon_exts.get(node.path.name)
 
     def search_text_hl(node: Node, ignored: bool) -> Optional[str]:
         if ignored:
@@ -104,7 +91,7 @@ def _paint(
             if fnmatch(node.path.name, pattern):
                 return hl
 
-        hl = ext_exact.get(node.path.suffix)
+        hl = ext_exact.get(node.path.name)
         if hl:
             return hl
 
@@ -133,7 +120,7 @@ def _paint(
         else:
             yield (
                 icons.name_exact.get(node.path.name, "")
-                or icons.ext_exact.get(node.path.suffix, "")
+                or glyph_exts.get(node.path.name)
                 or next(
                     (
                         v
@@ -208,6 +195,7 @@ def _paint(
     return show
 
 
+@timed("render")
 def render(
     node: Node,
     *,
@@ -229,7 +217,6 @@ def render(
         show_hidden=show_hidden,
         current=current,
     )
-    comp = _gen_comp(settings.view.sort_by)
     keep_open = {node.path}
 
     def render(node: Node, *, depth: int, cleared: bool) -> Iterator[_NRender]:
@@ -243,7 +230,7 @@ def render(
         if rend:
 
             def gen_children() -> Iterator[_NRender]:
-                for child in sorted(node.children.values(), key=comp):
+                for child in children_of(node):
                     yield from render(child, depth=depth + 1, cleared=clear)
 
             children = tuple(gen_children())
@@ -251,7 +238,10 @@ def render(
                 yield (node, *rend)
             yield from iter(children)
 
-    rendered = render(node, depth=0, cleared=False)
+    with sorted_children(
+        settings.view.sort_by, collation=settings.view.collation
+    ) as children_of:
+        rendered = tuple(render(node, depth=0, cleared=False))
     _nodes, _lines, _highlights, _badges = zip(*rendered)
     nodes, lines, highlights, badges = (
         cast(Sequence[Node], _nodes),
@@ -259,7 +249,7 @@ def render(
         cast(Sequence[Sequence[Highlight]], _highlights),
         cast(Sequence[Sequence[Badge]], _badges),
     )
-    hashed = tuple(str(hash(zipped)) for zipped in zip(lines, highlights, badges))
+    hashed = tuple(_fingerprint(*zipped) for zipped in zip(lines, highlights, badges))
     path_row_lookup = {node.path: idx for idx, node in enumerate(nodes)}
     derived = Derived(
         lines=lines,
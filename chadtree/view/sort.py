@@ -0,0 +1,115 @@
+from contextlib import contextmanager
+from enum import IntEnum, auto
+from functools import lru_cache
+from locale import strxfrm
+from pathlib import PurePath
+from re import compile
+from threading import Lock
+from typing import (
+    Any,
+    Callable,
+    Iterator,
+    Mapping,
+    MutableMapping,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+from std2.types import never
+
+from ..consts import COLLATION_CACHE_SIZE
+from ..fs.cartographer import is_dir
+from ..fs.types import Node
+from .types import Collation, Sortby
+
+_DIGITS = compile(r"(\d+)")
+
+
+class _CompVals(IntEnum):
+    FOLDER = auto()
+    FILE = auto()
+
+
+_Opts = Tuple[Sequence[Sortby], Collation]
+_Snapshot = Tuple[Mapping[PurePath, Node], Sequence[Node]]
+
+_lock = Lock()
+_snapshots: Tuple[Optional[_Opts], Mapping[PurePath, _Snapshot]] = (None, {})
+
+
+def _natural(text: str) -> Sequence[Any]:
+    """
+    -> alternating (text, number, text, ...)
+    """
+
+    parts = _DIGITS.split(text.casefold())
+    return tuple(int(part) if idx % 2 else part for idx, part in enumerate(parts))
+
+
+@lru_cache(maxsize=COLLATION_CACHE_SIZE)
+def collate(collation: Collation, text: str) -> Any:
+    if collation is Collation.locale:
+        return strxfrm(text)
+    elif collation is Collation.bytes:
+        return text.encode("UTF-8", "surrogateescape")
+    elif collation is Collation.casefold:
+        return text.casefold()
+    elif collation is Collation.natural:
+        return _natural(text)
+    else:
+        never(collation)
+
+
+def _gen_comp(sortby: Sequence[Sortby], collation: Collation) -> Callable[[Node], Any]:
+    def comp(node: Node) -> Sequence[Any]:
+        def cont() -> Iterator[Any]:
+            for sb in sortby:
+                if sb is Sortby.is_folder:
+                    yield _CompVals.FOLDER if is_dir(node) else _CompVals.FILE
+                elif sb is Sortby.ext:
+                    yield collate(collation, node.path.suffix),
+                elif sb is Sortby.file_name:
+                    yield collate(collation, node.path.name)
+                else:
+                    never(sb)
+
+        return tuple(cont())
+
+    return comp
+
+
+@contextmanager
+def sorted_children(
+    sortby: Sequence[Sortby], collation: Collation
+) -> Iterator[Callable[[Node], Sequence[Node]]]:
+    """
+    Children are only re-sorted if their directory snapshot changed
+    """
+
+    global _snapshots
+
+    opts = (tuple(sortby), collation)
+    with _lock:
+        p_opts, p_snapshots = _snapshots
+    prev = p_snapshots if p_opts == opts else {}
+    acc: MutableMapping[PurePath, _Snapshot] = {}
+    comp = _gen_comp(sortby, collation=collation)
+
+    def cont(node: Node) -> Sequence[Node]:
+        children = node.children
+        if not children:
+            return ()
+        else:
+            snapshot = prev.get(node.path)
+            if snapshot and snapshot[0] is children:
+                _, ordered = snapshot
+            else:
+                ordered = tuple(sorted(children.values(), key=comp))
+            acc[node.path] = (children, ordered)
+            return ordered
+
+    yield cont
+
+    with _lock:
+        _snapshots = (opts, acc)
@@ -0,0 +1,45 @@
+from typing import Generic, Mapping, MutableMapping, Optional, TypeVar
+
+T = TypeVar("T")
+
+GLOB_CHARS = frozenset("*?[")
+
+
+class _Node(Generic[T]):
+    __slots__ = ("children", "value", "whole")
+
+    def __init__(self) -> None:
+        self.children: MutableMapping[str, _Node[T]] = {}
+        self.value: Optional[T] = None
+        self.whole = False
+
+
+class SuffixTrie(Generic[T]):
+    """
+    Reversed suffix trie, longest match in `O(len(name))`
+
+    -> `.tar.gz` beats `.gz`, keys may be compound, ie. `.d.ts`
+
+    -> Keys starting with `.` are extensions, like `PurePath.suffix`, not whole names
+    """
+
+    def __init__(self, mapping: Mapping[str, T]) -> None:
+        self._root: _Node[T] = _Node()
+        for key, value in mapping.items():
+            if key:
+                node = self._root
+                for char in reversed(key):
+                    node = node.children.setdefault(char, _Node())
+                node.value, node.whole = value, not key.startswith(".")
+
+    def get(self, name: str) -> Optional[T]:
+        node, found = self._root, None
+        for idx in range(len(name) - 1, -1, -1):
+            child = node.children.get(name[idx])
+            if child is None:
+                break
+            else:
+                node = child
+                if node.value is not None and (idx or node.whole):
+                    found = node.value
+        return found
@@ -8,6 +8,7 @@ from pynvim_pp.highlight import HLgroup
 from chad_types import IconGlyphs
 
 from ..fs.types import Mode, Node
+from .suffixes import SuffixTrie
 
 
 @dataclass(frozen=True)
@@ -19,13 +20,13 @@ class HLGroups:
 
 @dataclass(frozen=True)
 class HLcontext:
-    groups: Sequence[HLgroup]
-    icon_exts: Mapping[str, str]
+    groups: Mapping[str, HLgroup]
+    icon_exts: SuffixTrie[str]
     mode_pre: Mapping[Mode, str]
     mode_post: Mapping[Optional[Mode], str]
     name_exact: Mapping[str, str]
     name_glob: Mapping[str, str]
-    ext_exact: Mapping[str, str]
+    ext_exact: SuffixTrie[str]
     particular_mappings: HLGroups
 
 
@@ -35,10 +36,20 @@ class Sortby(Enum):
     file_name = auto()
 
 
+class Collation(Enum):
+    locale = auto()
+    bytes = auto()
+    casefold = auto()
+    natural = auto()
+
+
 @dataclass(frozen=True)
 class ViewOptions:
+    collation: Collation
     hl_context: HLcontext
     icons: IconGlyphs
+    icon_glyph_exts: SuffixTrie[str]
+    lazy_decorations: bool
     sort_by: Sequence[Sortby]
     time_fmt: str
     use_icons: bool
@@ -148,5 +148,14 @@ return function(args)
 
     set_chad_call("CHADhelp")
     vim.api.nvim_command [[command! -nargs=* CHADhelp lua chad.CHADhelp(<f-args>)]]
+
+    set_chad_call("CHADprofile")
+    vim.api.nvim_command [[command! -nargs=0 CHADprofile lua chad.CHADprofile()]]
+
+    set_chad_call("CHADreload")
+    vim.api.nvim_command [[command! -nargs=0 CHADreload lua chad.CHADreload()]]
+
+    set_chad_call("CHADcancel")
+    vim.api.nvim_command [[command! -nargs=0 CHADcancel lua chad.CHADcancel()]]
   end
 end